@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Run multiple simulations concurrently across persona/goal pairs.
+Usage: python run_many.py [personas] [goals] [model] [concurrency]
+Personas and goals are comma-separated lists; both default to all predefined.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import httpx
+from dotenv import load_dotenv
+from colorama import init, Fore, Style
+
+from src.simulation_runner import SimulationRunner
+from src.personas import PREDEFINED_PERSONAS
+from src.goals import PREDEFINED_GOALS
+from src.types import SimulationConfig
+
+# Initialize colorama
+init(autoreset=True)
+
+# uvloop halves per-I/O event loop overhead for the many short HTTPS
+# round-trips a sweep makes; it's a soft dependency, so fall back silently
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def run_many(pairs, openai_api_key, assistant_api_url, model, concurrency=DEFAULT_CONCURRENCY):
+    """Run simulations for all (persona_id, goal_id) pairs concurrently.
+
+    Concurrency is capped with a semaphore to respect OpenAI and assistant
+    rate limits. Runners are fully async, so all runs share this event loop
+    and asyncio.gather overlaps their network waits.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    # One pooled connection shared by every runner: concurrent simulations
+    # reuse keep-alive connections instead of opening a pool each
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+    async def run_one(persona_id, goal_id):
+        async with sem:
+            config = SimulationConfig(
+                model=model,
+                persona=PREDEFINED_PERSONAS[persona_id],
+                goal=PREDEFINED_GOALS[goal_id],
+                max_turns=20,
+                api_endpoint=assistant_api_url,
+                simulation_id=f"{persona_id}-{goal_id}-{int(time.time() * 1000)}",
+                quiet=True,
+            )
+            runner = SimulationRunner(config, openai_api_key, http_client=http_client)
+            return await runner.run_async()
+
+    try:
+        return await asyncio.gather(
+            *(run_one(p, g) for p, g in pairs),
+            return_exceptions=True,
+        )
+    finally:
+        await http_client.aclose()
+
+
+def main():
+    """Run a sweep of simulations across personas and goals."""
+    openai_api_key = os.getenv('OPENAI_API_KEY')
+    assistant_api_url = os.getenv('ASSISTANT_API_URL', 'http://localhost:3000/api/chat')
+    model = os.getenv('OPENAI_MODEL', 'gpt-4o')
+
+    if not openai_api_key:
+        print(f"{Fore.RED}❌ OPENAI_API_KEY not found in environment variables")
+        sys.exit(1)
+
+    args = sys.argv[1:]
+    persona_ids = args[0].split(',') if len(args) > 0 else list(PREDEFINED_PERSONAS.keys())
+    goal_ids = args[1].split(',') if len(args) > 1 else list(PREDEFINED_GOALS.keys())
+    if len(args) > 2:
+        model = args[2]
+    concurrency = int(args[3]) if len(args) > 3 else DEFAULT_CONCURRENCY
+
+    unknown_personas = [p for p in persona_ids if p not in PREDEFINED_PERSONAS]
+    if unknown_personas:
+        print(f"{Fore.RED}❌ Unknown personas: {', '.join(unknown_personas)}")
+        print(f"Available personas: {', '.join(PREDEFINED_PERSONAS.keys())}")
+        sys.exit(1)
+
+    unknown_goals = [g for g in goal_ids if g not in PREDEFINED_GOALS]
+    if unknown_goals:
+        print(f"{Fore.RED}❌ Unknown goals: {', '.join(unknown_goals)}")
+        print(f"Available goals: {', '.join(PREDEFINED_GOALS.keys())}")
+        sys.exit(1)
+
+    pairs = [(p, g) for p in persona_ids for g in goal_ids]
+
+    print(f"{Fore.CYAN}{Style.BRIGHT}\nAI Assistant Multi-Turn Evaluation System - Batch Run")
+    print("=" * 50)
+    print(f"{Fore.WHITE}Using model: {model}")
+    print(f"{Fore.WHITE}Simulations: {len(pairs)} (concurrency: {concurrency})")
+
+    results = asyncio.run(
+        run_many(pairs, openai_api_key, assistant_api_url, model, concurrency)
+    )
+
+    failures = [
+        (pair, result)
+        for pair, result in zip(pairs, results)
+        if isinstance(result, Exception)
+    ]
+
+    print(f"{Fore.GREEN}\nCompleted {len(pairs) - len(failures)}/{len(pairs)} simulations")
+    for (persona_id, goal_id), error in failures:
+        print(f"{Fore.RED}  - {persona_id}/{goal_id} failed: {error}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
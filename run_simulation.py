@@ -1,30 +1,30 @@
 #!/usr/bin/env python3
 """
 Run a single simulation with specified persona and goal.
-Usage: python run_simulation.py [persona] [goal] [model]
+Usage: python run_simulation.py [persona] [goal] [model] [--no-cache]
 Model can also be set via OPENAI_MODEL environment variable.
+Pass --no-cache to disable the conversation snapshot cache.
+
+Heavy imports (simulation runner, OpenAI client, colorama, dotenv) are
+deferred into the code paths that need them so --help style invocations
+stay fast when scripting many runs.
 """
 
 import os
 import sys
-import time
-from dotenv import load_dotenv
-from colorama import init, Fore, Style
 
-from src.simulation_runner import SimulationRunner
-from src.personas import PREDEFINED_PERSONAS
-from src.goals import PREDEFINED_GOALS
-from src.types import SimulationConfig
 
-# Initialize colorama
-init(autoreset=True)
+def main():
+    """Main function to run a single simulation."""
+    from dotenv import load_dotenv
+    from colorama import init, Fore, Style
 
-# Load environment variables
-load_dotenv()
+    init(autoreset=True)
+    load_dotenv()
 
+    from src.personas import PREDEFINED_PERSONAS
+    from src.goals import PREDEFINED_GOALS
 
-def main():
-    """Main function to run a single simulation."""
     openai_api_key = os.getenv('OPENAI_API_KEY')
     assistant_api_url = os.getenv('ASSISTANT_API_URL', 'http://localhost:3000/api/chat')
     model = os.getenv('OPENAI_MODEL', 'gpt-4o')
@@ -35,6 +35,8 @@ def main():
 
     # Get persona, goal, and optionally model from command line args
     args = sys.argv[1:]
+    snapshot_cache = '--no-cache' not in args
+    args = [a for a in args if not a.startswith('--')]
     persona_id = args[0] if len(args) > 0 else 'average_user'
     goal_id = args[1] if len(args) > 1 else 'learn_basic_concept'
     # Allow model to be overridden via third argument
@@ -55,6 +57,12 @@ def main():
         print(f"Available goals: {', '.join(PREDEFINED_GOALS.keys())}")
         sys.exit(1)
 
+    # Import the runner only after arg validation: it drags in the OpenAI
+    # and HTTP client stacks, which dominate cold-start time
+    import time
+    from src.simulation_runner import SimulationRunner
+    from src.types import SimulationConfig
+
     # Create simulation config
     config = SimulationConfig(
         model=model,
@@ -63,6 +71,7 @@ def main():
         max_turns=20,
         api_endpoint=assistant_api_url,
         simulation_id=f"{persona_id}-{goal_id}-{int(time.time() * 1000)}",
+        snapshot_cache=snapshot_cache,
     )
 
     print(f"{Fore.CYAN}{Style.BRIGHT}\nAI Assistant Multi-Turn Evaluation System")
@@ -79,18 +88,22 @@ def main():
         print(f"{Fore.RED}\nSimulation failed: {e}")
         sys.exit(1)
 
-def print_help():    
-    print(f"{Fore.CYAN}Usage: python run_simulation.py [persona] [goal] [model]")
-    print(f"{Fore.CYAN}Available personas: {', '.join(PREDEFINED_PERSONAS.keys())}, default: {list(PREDEFINED_PERSONAS.keys())[0]}")
-    print(f"{Fore.CYAN}Available goals: {', '.join(PREDEFINED_GOALS.keys())}, default: {list(PREDEFINED_GOALS.keys())[0]}")
-    print(f"{Fore.CYAN}Model: Can be set via OPENAI_MODEL environment variable or as third argument, default: gpt-4o")
-    print(f"{Fore.CYAN}Example: python run_simulation.py average_user learn_basic_concept")
-    print(f"{Fore.CYAN}Example: python run_simulation.py average_user learn_basic_concept gpt-5")
+def print_help():
+    # Help stays colorama-free so it costs only the personas/goals import
+    from src.personas import PREDEFINED_PERSONAS
+    from src.goals import PREDEFINED_GOALS
+
+    print("Usage: python run_simulation.py [persona] [goal] [model] [--no-cache]")
+    print(f"Available personas: {', '.join(PREDEFINED_PERSONAS.keys())}, default: {list(PREDEFINED_PERSONAS.keys())[0]}")
+    print(f"Available goals: {', '.join(PREDEFINED_GOALS.keys())}, default: {list(PREDEFINED_GOALS.keys())[0]}")
+    print("Model: Can be set via OPENAI_MODEL environment variable or as third argument, default: gpt-4o")
+    print("Example: python run_simulation.py average_user learn_basic_concept")
+    print("Example: python run_simulation.py average_user learn_basic_concept gpt-5")
     sys.exit(0)
 
 if __name__ == "__main__":
-    print(f"{Fore.CYAN}AI Assistant Multi-Turn Evaluation System")
+    print("AI Assistant Multi-Turn Evaluation System")
     if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h', '/?', 'help']:
         print_help()
     else:
-        main()
\ No newline at end of file
+        main()
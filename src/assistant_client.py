@@ -1,26 +1,307 @@
 import time
-import json
+import uuid
+import hashlib
+from dataclasses import dataclass
+import orjson
+import diskcache
+import httpx
 import requests
-from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter, Retry
+from typing import Callable, Dict, List, Optional, Tuple
 from src.types import Message
 
 
-class AssistantClientConfig:
-    def __init__(
-        self,
-        api_endpoint: str,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: int = 30000
+def _serialize_history(
+    cache: List[Dict],
+    conversation_history: List[Message],
+    message: str,
+    history_len: Optional[int] = None
+) -> List[Dict]:
+    """Build the AI SDK UIMessage array, serializing only new history entries.
+
+    `cache` is the client's append-only list of already-serialized history
+    entries, so each turn only pays for the new messages instead of
+    re-building the full array (O(N^2) across a simulation).
+
+    `history_len` bounds how much of conversation_history counts as history,
+    letting callers pass their live message list by reference (with the
+    current message still at the end) instead of slicing off a copy.
+    """
+    if history_len is None:
+        history_len = len(conversation_history)
+
+    if history_len < len(cache):
+        # Conversation was reset; drop the stale cache
+        cache.clear()
+
+    for i in range(len(cache), history_len):
+        msg = conversation_history[i]
+        cache.append({
+            'id': f'msg-{i}',
+            'role': msg.role,
+            'parts': [{'type': 'text', 'text': msg.content}]
+        })
+
+    # Add the new user message (not cached: it joins the history next turn)
+    return cache + [{
+        'id': f'msg-{history_len}',
+        'role': 'user',
+        'parts': [{'type': 'text', 'text': message}]
+    }]
+
+
+def _build_request_data(
+    messages: List[Dict],
+    conversation_id: Optional[str],
+    bootstrap: bool
+) -> Dict:
+    """Build the request body, using the incremental KV-reuse shape when enabled.
+
+    With a conversation_id, turns after the first carry only the new user
+    message; the server is expected to look up prior turns (and their cached
+    KV state) by id. The first call still bootstraps the full history.
+    """
+    if conversation_id is None:
+        return {'messages': messages}
+
+    request_data = {
+        'conversation_id': conversation_id,
+        'message': messages[-1],
+    }
+    if bootstrap:
+        request_data['messages'] = messages
+    return request_data
+
+
+def _extract_text_fields(node, parts: List[str]):
+    """Collect assistant text from a parsed JSON body without rebuilding it.
+
+    Walks the tree once and appends only the text-bearing fields the stream
+    formats use ('delta', 'text', 'content'), so a large single-object reply
+    is reduced to its message text in one pass.
+    """
+    if isinstance(node, dict):
+        for key in ('delta', 'text', 'content'):
+            value = node.get(key)
+            if isinstance(value, str):
+                parts.append(value)
+            elif isinstance(value, (dict, list)):
+                _extract_text_fields(value, parts)
+        for key, value in node.items():
+            if key not in ('delta', 'text', 'content') and isinstance(value, (dict, list)):
+                _extract_text_fields(value, parts)
+    elif isinstance(node, list):
+        for item in node:
+            _extract_text_fields(item, parts)
+
+
+def _handle_nextjs_payload(payload: bytes, parts: List[str]):
+    """Handle the payload of a Next.js streaming line (after the 0: prefix)."""
+    content = payload.strip()
+    if not content or content in (b'"', b'""'):
+        return
+
+    # Fast path: a plain quoted string with no escapes needs no JSON parse —
+    # slice off the quotes and decode the payload directly
+    if (
+        len(content) >= 2
+        and content[0:1] == b'"'
+        and content[-1:] == b'"'
+        and b'\\' not in content
     ):
-        self.api_endpoint = api_endpoint
-        self.headers = headers or {}
-        self.timeout = timeout / 1000  # Convert to seconds
+        parts.append(content[1:-1].decode('utf-8'))
+        return
+
+    try:
+        parsed = orjson.loads(content)
+        parts.append(parsed if isinstance(parsed, str) else str(parsed))
+    except orjson.JSONDecodeError:
+        # Remove quotes and add content
+        parts.append(content.strip(b'"').decode('utf-8'))
+
+
+def _handle_sse_payload(payload: bytes, parts: List[str]) -> Optional[str]:
+    """Handle an SSE data payload. Returns an error message if one was streamed."""
+    data = payload.strip()
+    if not data or data == b'[DONE]':
+        return None
+
+    try:
+        parsed = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Fallback: treat as raw text if not JSON
+        if not data.startswith(b'{'):
+            parts.append(data.decode('utf-8'))
+        return None
+
+    # Handle AI SDK message format
+    if parsed.get('type') == 'error':
+        return parsed.get('errorText', 'Unknown error')
+    elif parsed.get('type') == 'text-delta':
+        parts.append(parsed.get('delta', ''))
+    elif parsed.get('type') == 'text':
+        parts.append(parsed.get('text', ''))
+
+    # Handle OpenAI streaming format (fallback)
+    elif 'choices' in parsed and parsed['choices']:
+        delta = parsed['choices'][0].get('delta', {})
+        if 'content' in delta:
+            parts.append(delta['content'])
+
+    return None
+
+
+def _handle_plain_line(line: bytes, parts: List[str]):
+    """Handle a line with no recognized stream prefix."""
+    if not line.strip():
+        return
+    # Try to parse as JSON first
+    try:
+        parsed = orjson.loads(line)
+        parts.append(parsed if isinstance(parsed, str) else str(parsed))
+    except orjson.JSONDecodeError:
+        parts.append(line.decode('utf-8'))
+
+
+@dataclass(slots=True)
+class AssistantClientConfig:
+    """Configuration for the assistant HTTP clients.
+
+    cache_enabled: cache responses on disk keyed by the serialized
+        conversation, so re-runs during development skip the HTTP call.
+    kv_reuse: after the first call send only the new user message plus a
+        stable conversation_id (with an X-Reuse-KV: 1 header) so the backend
+        can reuse cached KV state instead of re-prefilling the full history.
+        Requires backend support; leave off for stateless servers.
+    max_history_messages: when set (and the client has a summarizer), history
+        older than the last N entries is folded into a rolling summary
+        message, keeping the per-turn payload bounded.
+    """
+    api_endpoint: str
+    headers: Optional[Dict[str, str]] = None
+    timeout: float = 30000
+    cache_enabled: bool = False
+    kv_reuse: bool = False
+    max_history_messages: Optional[int] = None
+
+    def __post_init__(self):
+        self.headers = self.headers or {}
+        self.timeout = self.timeout / 1000  # Convert to seconds
+
+
+def make_history_summarizer(openai_client, model: str = 'gpt-4o-mini'):
+    """Build a summarizer callable for AssistantClient history compaction.
+
+    `openai_client` is any client exposing chat.completions.create. The
+    returned callable takes (messages, previous_summary) and produces an
+    updated running summary of the aged-out messages.
+    """
+    def summarize(messages: List[Message], previous_summary: Optional[str]) -> str:
+        transcript = '\n'.join(f"{m.role}: {m.content}" for m in messages)
+        prompt = (
+            "Summarize the following conversation excerpt in a few sentences, "
+            "keeping every fact needed to continue the conversation.\n\n"
+        )
+        if previous_summary:
+            prompt += f"Summary so far:\n{previous_summary}\n\n"
+        prompt += f"New messages:\n{transcript}"
+
+        response = openai_client.chat.completions.create(
+            model=model,
+            messages=[{'role': 'user', 'content': prompt}],
+            max_completion_tokens=200,
+        )
+        return response.choices[0].message.content or (previous_summary or '')
+
+    return summarize
 
 
 class AssistantClient:
-    def __init__(self, config: AssistantClientConfig):
+    def __init__(self, config: AssistantClientConfig, summarizer=None):
         self.config = config
 
+        # Optional rolling-summary compaction of long histories (see
+        # AssistantClientConfig.max_history_messages and make_history_summarizer)
+        self._summarizer = summarizer
+        self._summary_text: Optional[str] = None
+        self._summarized_count = 0
+
+        # One session per client so all turns of a simulation reuse
+        # keep-alive connections instead of re-handshaking every call.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+            ),
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+        self._base_headers = {
+            'Content-Type': 'application/json',
+            'Accept': '*/*',
+            'User-Agent': 'AI-Simulation-Client/1.0',
+            **self.config.headers
+        }
+        if config.kv_reuse:
+            self._base_headers['X-Reuse-KV'] = '1'
+
+        # Append-only cache of already-serialized history entries
+        self._serialized: List[Dict] = []
+
+        # KV-reuse state: stable id for this conversation, and whether the
+        # full history still needs to be bootstrapped to the server
+        self._conversation_id = uuid.uuid4().hex if config.kv_reuse else None
+        self._bootstrapped = False
+
+        self._cache = diskcache.Cache('.cache/assistant') if config.cache_enabled else None
+
+    def close(self):
+        """Close the underlying session and its connection pool."""
+        self._session.close()
+
+    def _compact_history(
+        self,
+        conversation_history: List[Message],
+        message: str
+    ) -> List[Dict]:
+        """Fold aged-out history into a rolling summary, keeping the payload bounded."""
+        max_kept = self.config.max_history_messages
+        kept = conversation_history[-max_kept:]
+        aged = conversation_history[:len(conversation_history) - max_kept]
+
+        # Only re-summarize when messages have aged out since the last turn
+        if len(aged) > self._summarized_count:
+            self._summary_text = self._summarizer(
+                aged[self._summarized_count:],
+                self._summary_text,
+            )
+            self._summarized_count = len(aged)
+
+        messages = []
+        if self._summary_text:
+            messages.append({
+                'id': 'msg-summary',
+                'role': 'system',
+                'parts': [{'type': 'text', 'text': f'Summary of earlier conversation: {self._summary_text}'}]
+            })
+        for i, msg in enumerate(kept):
+            messages.append({
+                'id': f'msg-{self._summarized_count + i}',
+                'role': msg.role,
+                'parts': [{'type': 'text', 'text': msg.content}]
+            })
+        messages.append({
+            'id': f'msg-{len(conversation_history)}',
+            'role': 'user',
+            'parts': [{'type': 'text', 'text': message}]
+        })
+        return messages
+
     def send_message(
         self,
         message: str,
@@ -30,142 +311,489 @@ class AssistantClient:
         Send a message to the assistant and get a response.
         Returns: (response, response_time_ms, error)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            # Build messages array in AI SDK UIMessage format
-            messages = []
-            for i, msg in enumerate(conversation_history):
-                messages.append({
-                    'id': f'msg-{i}',
-                    'role': msg.role,
-                    'parts': [{'type': 'text', 'text': msg.content}]
-                })
-
-            # Add the new user message
-            messages.append({
-                'id': f'msg-{len(conversation_history)}',
-                'role': 'user',
-                'parts': [{'type': 'text', 'text': message}]
-            })
+            max_kept = self.config.max_history_messages
+            if (
+                self._summarizer is not None
+                and max_kept is not None
+                and len(conversation_history) > max_kept
+            ):
+                messages = self._compact_history(conversation_history, message)
+            else:
+                messages = _serialize_history(self._serialized, conversation_history, message)
+
+            cache_key = None
+            if self._cache is not None:
+                cache_key = hashlib.blake2b(orjson.dumps(messages), digest_size=16).digest()
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+                    return cached, response_time, None
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Accept': '*/*',
-                'User-Agent': 'AI-Simulation-Client/1.0',
-                **self.config.headers
-            }
+            request_data = _build_request_data(
+                messages,
+                self._conversation_id,
+                bootstrap=not self._bootstrapped,
+            )
 
-            request_data = {'messages': messages}
+            # Encode once with orjson (UTF-8 output, no \uXXXX escaping)
+            # instead of requests' internal json.dumps
+            body = orjson.dumps(request_data)
 
             # Make the request with streaming enabled
-            response = requests.post(
+            with self._session.post(
                 self.config.api_endpoint,
-                json=request_data,
-                headers=headers,
+                data=body,
+                headers=self._base_headers,
                 timeout=self.config.timeout,
                 stream=True
-            )
+            ) as response:
 
-            if not response.ok:
-                # Try to get more details about the error
+                if not response.ok:
+                    # Read at most 4 KiB of the error body: unhealthy backends can
+                    # return multi-MB stack traces on every failed turn
+                    error_body = response.raw.read(4096).decode('utf-8', errors='replace')
+                    raise Exception(f"API responded with status {response.status_code}: {error_body}")
+
+                self._bootstrapped = True
+
+                # Non-streaming replies (no SSE content type, no chunked transfer)
+                # don't need line framing at all: read the body once and return.
+                content_type = response.headers.get('Content-Type', '')
+                if (
+                    'text/event-stream' not in content_type
+                    and response.headers.get('Transfer-Encoding', '') != 'chunked'
+                ):
+                    body = response.content
+                    if 'application/json' in content_type:
+                        # Parse the body once and pull out only the text fields
+                        # instead of returning (or line-scanning) the raw JSON
+                        try:
+                            parsed = orjson.loads(body)
+                        except orjson.JSONDecodeError:
+                            full_response = body.decode('utf-8', errors='replace')
+                        else:
+                            if isinstance(parsed, str):
+                                full_response = parsed
+                            else:
+                                extracted: List[str] = []
+                                _extract_text_fields(parsed, extracted)
+                                full_response = ''.join(extracted) or body.decode('utf-8', errors='replace')
+                    else:
+                        full_response = body.decode('utf-8', errors='replace')
+                    result = full_response.strip() or 'No response received'
+                    if cache_key is not None:
+                        self._cache.set(cache_key, result)
+                    response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+                    return result, response_time, None
+
+                # Handle streaming response with better error handling.
+                # Chunks are collected in a list and joined once at the end; for
+                # streams with many small deltas this avoids the repeated str +=
+                # reallocation pattern.
+                parts: List[str] = []
+                error_message = None
                 try:
-                    error_body = response.text
+                    # iter_lines yields raw bytes; prefixes are matched with byte
+                    # slice comparisons and payloads handed to orjson directly, so
+                    # blank lines and SSE comments are dropped without ever being
+                    # decoded to str.
+                    for line in response.iter_lines():
+                        if not line or line[0:1] == b':':
+                            continue
+
+                        if line[:2] == b'0:':
+                            _handle_nextjs_payload(line[2:], parts)
+                        elif line[:6] == b'data: ':
+                            err = _handle_sse_payload(line[6:], parts)
+                            if err is not None:
+                                error_message = err
+                                break
+                        else:
+                            _handle_plain_line(line, parts)
+
+                    full_response = ''.join(parts)
+
+                    # If no content was found in streaming, try to get the full response
+                    if not full_response.strip() and error_message is None:
+                        try:
+                            response_text = response.text
+                            if response_text:
+                                full_response = response_text
+                        except:
+                            pass
+
+                except Exception as parse_error:
+                    # Fallback to full response text
+                    try:
+                        full_response = response.text
+                    except:
+                        raise Exception(f"Response parsing error: {parse_error}")
+
+                response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+                # Return error if one was detected in the stream; drop the
+                # rest of it so the connection goes back to the pool instead
+                # of lingering in CLOSE_WAIT until GC
+                if error_message:
+                    response.close()
+                    return '', response_time, error_message
+
+                result = full_response.strip() or 'No response received'
+                if cache_key is not None:
+                    self._cache.set(cache_key, result)
+                return result, response_time, None
+
+        except requests.Timeout:
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+            return '', response_time, 'Request timeout'
+
+        except Exception as e:
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+            return '', response_time, str(e)
+
+    def send_batch(
+        self,
+        messages: List[str],
+        conversation_history: List[Message]
+    ) -> List[Tuple[str, float, Optional[str]]]:
+        """
+        Send a pre-planned pipeline of user turns in one HTTP round trip.
+
+        POSTs the serialized history plus a 'pipeline' of the K user messages;
+        the backend streams back SSE events carrying a 'turn_index' field,
+        which are demuxed into K (response, response_time_ms, error) tuples.
+        Saves (K-1) round trips on network-bound runs, but requires backend
+        support: a 415 response falls back to sequential send_message calls.
+        """
+        if not messages:
+            return []
+
+        start_ns = time.perf_counter_ns()
+
+        try:
+            # _serialize_history returns cache + new user message; slice the
+            # trailing entry off to get just the serialized history, since the
+            # pipelined turns travel separately
+            history = _serialize_history(
+                self._serialized, conversation_history, messages[0]
+            )[:-1]
+            body = orjson.dumps({'messages': history, 'pipeline': list(messages)})
+
+            with self._session.post(
+                self.config.api_endpoint,
+                data=body,
+                headers=self._base_headers,
+                timeout=self.config.timeout,
+                stream=True
+            ) as response:
+
+                if response.status_code == 415:
+                    # Backend doesn't understand the pipeline shape
+                    response.close()
+                    return self._send_batch_sequential(messages, conversation_history)
+
+                if not response.ok:
+                    error_body = response.raw.read(4096).decode('utf-8', errors='replace')
                     raise Exception(f"API responded with status {response.status_code}: {error_body}")
-                except Exception as err_e:
-                    raise Exception(f"API responded with status {response.status_code}")
 
-            # Handle streaming response with better error handling
-            full_response = ''
-            error_message = None
-            try:
+                parts_by_turn: List[List[str]] = [[] for _ in messages]
+                errors: List[Optional[str]] = [None] * len(messages)
+                turn_done_ns: List[Optional[int]] = [None] * len(messages)
+                current_turn = 0
+
                 for line in response.iter_lines():
-                    if line:
-                        line_str = line.decode('utf-8')
-
-                        # Handle Next.js streaming format (0:...)
-                        if line_str.startswith('0:'):
-                            content = line_str[2:].strip()
-                            if content and content not in ['"', '""']:
-                                try:
-                                    # Try to parse as JSON
-                                    parsed = json.loads(content)
-                                    if isinstance(parsed, str):
-                                        full_response += parsed
-                                    else:
-                                        full_response += str(parsed)
-                                except json.JSONDecodeError:
-                                    # Remove quotes and add content
-                                    content_cleaned = content.strip('"')
-                                    full_response += content_cleaned
-
-                        # Handle SSE format (data: ...)
-                        elif line_str.startswith('data: '):
-                            data = line_str[6:].strip()
-                            if data and data != '[DONE]':
-                                try:
-                                    parsed = json.loads(data)
-
-                                    # Handle AI SDK message format
-                                    if parsed.get('type') == 'error':
-                                        error_message = parsed.get('errorText', 'Unknown error')
-                                        break
-                                    elif parsed.get('type') == 'text-delta':
-                                        full_response += parsed.get('delta', '')
-                                    elif parsed.get('type') == 'text':
-                                        full_response += parsed.get('text', '')
-
-                                    # Handle OpenAI streaming format (fallback)
-                                    elif 'choices' in parsed and parsed['choices']:
-                                        delta = parsed['choices'][0].get('delta', {})
-                                        if 'content' in delta:
-                                            full_response += delta['content']
-
-                                except json.JSONDecodeError:
-                                    # Fallback: treat as raw text if not JSON
-                                    if not data.startswith('{'):
-                                        full_response += data
-
-                        # Handle plain text lines
-                        elif line_str.strip() and not line_str.startswith(':'):
-                            # Try to parse as JSON first
+                    if not line or line[0:1] == b':':
+                        continue
+
+                    # 'event: turn N' frames mark the start of the next turn's
+                    # events; payloads may also carry an explicit turn_index
+                    if line[:7] == b'event: ':
+                        frame = line[7:].strip()
+                        if frame.startswith(b'turn '):
                             try:
-                                parsed = json.loads(line_str)
+                                next_turn = int(frame[5:])
+                            except ValueError:
+                                continue
+                            if 0 <= next_turn < len(messages):
+                                turn_done_ns[current_turn] = time.perf_counter_ns()
+                                current_turn = next_turn
+                        continue
+
+                    if line[:6] != b'data: ':
+                        _handle_plain_line(line, parts_by_turn[current_turn])
+                        continue
+
+                    data = line[6:].strip()
+                    if not data or data == b'[DONE]':
+                        continue
+                    try:
+                        parsed = orjson.loads(data)
+                    except orjson.JSONDecodeError:
+                        if not data.startswith(b'{'):
+                            parts_by_turn[current_turn].append(data.decode('utf-8'))
+                        continue
+
+                    turn = parsed.get('turn_index', current_turn)
+                    if not (0 <= turn < len(messages)):
+                        turn = current_turn
+
+                    if parsed.get('type') == 'error':
+                        errors[turn] = parsed.get('errorText', 'Unknown error')
+                    elif parsed.get('type') == 'text-delta':
+                        parts_by_turn[turn].append(parsed.get('delta', ''))
+                    elif parsed.get('type') == 'text':
+                        parts_by_turn[turn].append(parsed.get('text', ''))
+                    elif 'choices' in parsed and parsed['choices']:
+                        delta = parsed['choices'][0].get('delta', {})
+                        if 'content' in delta:
+                            parts_by_turn[turn].append(delta['content'])
+
+                turn_done_ns[current_turn] = time.perf_counter_ns()
+
+                # Per-turn time is the delta between completion marks; turns the
+                # server never answered report zero
+                results: List[Tuple[str, float, Optional[str]]] = []
+                previous_ns = start_ns
+                for i in range(len(messages)):
+                    done_ns = turn_done_ns[i]
+                    elapsed_ms = (done_ns - previous_ns) / 1_000_000 if done_ns else 0.0
+                    if done_ns:
+                        previous_ns = done_ns
+                    text = ''.join(parts_by_turn[i]).strip()
+                    if errors[i]:
+                        results.append(('', elapsed_ms, errors[i]))
+                    else:
+                        results.append((text or 'No response received', elapsed_ms, None))
+                return results
+
+        except requests.Timeout:
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+            return [('', response_time, 'Request timeout')] * len(messages)
+
+        except Exception as e:
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+            return [('', response_time, str(e))] * len(messages)
+
+    def _send_batch_sequential(
+        self,
+        messages: List[str],
+        conversation_history: List[Message]
+    ) -> List[Tuple[str, float, Optional[str]]]:
+        """Fallback for backends without pipeline support: one call per turn."""
+        results: List[Tuple[str, float, Optional[str]]] = []
+        history = list(conversation_history)
+
+        for user_message in messages:
+            result = self.send_message(user_message, history)
+            results.append(result)
+            response, _, error = result
+            if error:
+                # Later turns were planned against this reply; don't send them
+                results.extend(
+                    ('', 0.0, 'Skipped: previous turn in batch failed')
+                    for _ in range(len(messages) - len(results))
+                )
+                break
+            now = time.monotonic_ns()
+            history.append(Message(
+                role='user', content=user_message,
+                timestamp=now, turn_number=len(history),
+            ))
+            history.append(Message(
+                role='assistant', content=response,
+                timestamp=now, turn_number=len(history),
+            ))
+
+        return results
+
+class AsyncAssistantClient:
+    """
+    Async variant of AssistantClient built on httpx.AsyncClient.
+
+    A single pooled connection is shared across all calls so concurrent
+    simulations reuse keep-alive connections instead of paying a TCP/TLS
+    handshake per turn.
+    """
+    def __init__(self, config: AssistantClientConfig, client: Optional[httpx.AsyncClient] = None):
+        self.config = config
+        # An injected client lets many runners share one connection pool
+        # (see run_many.py); a borrowed client is not closed by close()
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=config.timeout,
+        )
+
+        # Static headers merged once; send_message passes them unmodified
+        self._headers = {
+            'Content-Type': 'application/json',
+            'Accept': '*/*',
+            'User-Agent': 'AI-Simulation-Client/1.0',
+            **config.headers
+        }
+
+        if config.kv_reuse:
+            self._headers['X-Reuse-KV'] = '1'
+
+        # Append-only cache of already-serialized history entries
+        self._serialized: List[Dict] = []
+
+        # KV-reuse state (see AssistantClientConfig.kv_reuse)
+        self._conversation_id = uuid.uuid4().hex if config.kv_reuse else None
+        self._bootstrapped = False
+
+        self._cache = diskcache.Cache('.cache/assistant') if config.cache_enabled else None
+
+    async def close(self):
+        """Close the underlying connection pool, if this client owns it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def send_message(
+        self,
+        message: str,
+        conversation_history: List[Message],
+        on_delta: Optional[Callable[[str], None]] = None,
+        history_len: Optional[int] = None,
+    ) -> Tuple[str, float, Optional[str]]:
+        """
+        Send a message to the assistant and get a response.
+
+        When on_delta is given it is called with each text chunk as it
+        arrives, so callers can render the response incrementally instead
+        of waiting for the full body. history_len optionally bounds how
+        many leading entries of conversation_history are history, so
+        callers can pass their full message list without slicing a copy.
+        Returns: (response, response_time_ms, error)
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            messages = _serialize_history(
+                self._serialized, conversation_history, message, history_len
+            )
+
+            cache_key = None
+            if self._cache is not None:
+                cache_key = hashlib.blake2b(orjson.dumps(messages), digest_size=16).digest()
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    if on_delta is not None:
+                        on_delta(cached)
+                    response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+                    return cached, response_time, None
+
+            request_data = _build_request_data(
+                messages,
+                self._conversation_id,
+                bootstrap=not self._bootstrapped,
+            )
+
+            # Collected chunks, joined once after the stream finishes
+            parts: List[str] = []
+            error_message = None
+
+            def emit(chunk: str):
+                parts.append(chunk)
+                if on_delta is not None:
+                    on_delta(chunk)
+
+            body = orjson.dumps(request_data)
+
+            async with self._client.stream(
+                'POST',
+                self.config.api_endpoint,
+                content=body,
+                headers=self._headers,
+            ) as response:
+                if response.status_code >= 400:
+                    # Read at most 4 KiB of the error body (see sync client)
+                    error_chunks = []
+                    size = 0
+                    async for chunk in response.aiter_bytes():
+                        error_chunks.append(chunk)
+                        size += len(chunk)
+                        if size >= 4096:
+                            break
+                    error_body = b''.join(error_chunks)[:4096].decode('utf-8', errors='replace')
+                    raise Exception(
+                        f"API responded with status {response.status_code}: {error_body}"
+                    )
+
+                self._bootstrapped = True
+
+                async for line_str in response.aiter_lines():
+                    if not line_str:
+                        continue
+
+                    # Handle Next.js streaming format (0:...)
+                    if line_str.startswith('0:'):
+                        content = line_str[2:].strip()
+                        if content and content not in ['"', '""']:
+                            try:
+                                parsed = orjson.loads(content)
                                 if isinstance(parsed, str):
-                                    full_response += parsed
+                                    emit(parsed)
                                 else:
-                                    full_response += str(parsed)
-                            except json.JSONDecodeError:
-                                full_response += line_str
+                                    emit(str(parsed))
+                            except orjson.JSONDecodeError:
+                                emit(content.strip('"'))
 
-                # If no content was found in streaming, try to get the full response
-                if not full_response.strip():
-                    try:
-                        response_text = response.text
-                        if response_text:
-                            full_response = response_text
-                    except:
-                        pass
+                    # Handle SSE format (data: ...)
+                    elif line_str.startswith('data: '):
+                        data = line_str[6:].strip()
+                        if data and data != '[DONE]':
+                            try:
+                                parsed = orjson.loads(data)
 
-            except Exception as parse_error:
-                # Fallback to full response text
-                try:
-                    full_response = response.text
-                except:
-                    raise Exception(f"Response parsing error: {parse_error}")
+                                if parsed.get('type') == 'error':
+                                    error_message = parsed.get('errorText', 'Unknown error')
+                                    break
+                                elif parsed.get('type') == 'text-delta':
+                                    emit(parsed.get('delta', ''))
+                                elif parsed.get('type') == 'text':
+                                    emit(parsed.get('text', ''))
 
-            response_time = (time.time() - start_time) * 1000
+                                # Handle OpenAI streaming format (fallback)
+                                elif 'choices' in parsed and parsed['choices']:
+                                    delta = parsed['choices'][0].get('delta', {})
+                                    if 'content' in delta:
+                                        emit(delta['content'])
+
+                            except orjson.JSONDecodeError:
+                                if not data.startswith('{'):
+                                    emit(data)
+
+                    # Handle plain text lines
+                    elif line_str.strip() and not line_str.startswith(':'):
+                        try:
+                            parsed = orjson.loads(line_str)
+                            if isinstance(parsed, str):
+                                emit(parsed)
+                            else:
+                                emit(str(parsed))
+                        except orjson.JSONDecodeError:
+                            emit(line_str)
+
+            full_response = ''.join(parts)
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
 
-            # Return error if one was detected in the stream
             if error_message:
                 return '', response_time, error_message
 
-            return full_response.strip() or 'No response received', response_time, None
+            result = full_response.strip() or 'No response received'
+            if cache_key is not None:
+                self._cache.set(cache_key, result)
+            return result, response_time, None
 
-        except requests.Timeout:
-            response_time = (time.time() - start_time) * 1000
+        except httpx.TimeoutException:
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             return '', response_time, 'Request timeout'
 
         except Exception as e:
-            response_time = (time.time() - start_time) * 1000
-            return '', response_time, str(e)
\ No newline at end of file
+            response_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+            return '', response_time, str(e)
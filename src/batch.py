@@ -0,0 +1,50 @@
+"""Multiprocess batch execution for large simulation sweeps.
+
+run_many.py overlaps simulations on one event loop, which covers the
+network waits — but evaluation parsing, report rendering and result
+serialization are CPU-bound Python that the GIL serializes across
+runners. run_batch_mp spreads whole simulations over worker processes
+instead, so that CPU work runs truly in parallel. Each worker builds its
+own runner (and with it its own OpenAI and HTTP clients — nothing is
+pickled across the process boundary except the config) and returns the
+result as a plain dict.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional
+
+from src.types import SimulationConfig
+
+
+def _run_one(config: SimulationConfig, openai_api_key: str) -> Dict[str, Any]:
+    """Run a single simulation in this process and return a plain dict."""
+    # Imported here so the forkserver parent stays free of the OpenAI and
+    # HTTP client stacks
+    from src.simulation_runner import SimulationRunner
+
+    result = SimulationRunner(config, openai_api_key).run()
+    return result.model_dump(mode='json')
+
+
+def run_batch_mp(
+    configs: List[SimulationConfig],
+    openai_api_key: str,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Run simulations across a process pool, one simulation per task.
+
+    Results come back as model_dump(mode='json') dicts in the order of
+    configs. Workers are started via forkserver so each begins from a
+    clean interpreter without inheriting live client state.
+    """
+    if workers is None:
+        workers = min(len(configs), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context('forkserver'),
+    ) as executor:
+        return list(executor.map(_run_one, configs, repeat(openai_api_key)))
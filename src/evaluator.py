@@ -1,5 +1,15 @@
-from typing import List, Tuple
-from openai import OpenAI
+import asyncio
+import bisect
+import hashlib
+import os
+import re
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+import diskcache
+import numpy as np
+import orjson
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
 from src.types import (
     ConversationState,
     ConversationGoal,
@@ -7,6 +17,321 @@ from src.types import (
     UserPersona,
 )
 
+# Overall-score weights as a vector so the weighted sum is one dot product:
+# goal, satisfaction, clarity, relevance, completeness, politeness, then the
+# error-rate and per-incident frustration penalties (negative)
+_SCORE_WEIGHTS = np.array([0.25, 0.15, 0.15, 0.20, 0.15, 0.05, -0.05, -0.02])
+
+# Grade thresholds for the 0-3 scale normalized to 0-1 (~1/3, 1.5/3, 2/3,
+# 2.5/3); bisect_right maps a score to its label without the if-chain
+_GRADE_CUTS = (0.33, 0.5, 0.67, 0.83)
+_GRADE_LABELS = (
+    '(Poor)',
+    '(Needs Improvement)',
+    '(Satisfactory)',
+    '(Good)',
+    '(Excellent)',
+)
+
+# Recommendation rules as (predicate, message) pairs; quality scores use the
+# 2/3 threshold (a rating of 2 on the 0-3 scale). One pass over this table
+# replaces the if-chain and keeps the rule set easy to extend.
+_RECOMMENDATION_RULES = (
+    (lambda m: not m.goal_achieved,
+     '- Focus on achieving user goals more effectively'),
+    (lambda m: m.clarity_score < 0.67,
+     '- Improve response clarity and structure'),
+    (lambda m: m.relevance_score < 0.67,
+     '- Stay more focused on user questions'),
+    (lambda m: m.completeness_score < 0.67,
+     '- Provide more comprehensive responses'),
+    (lambda m: m.politeness_score < 0.67,
+     '- Improve politeness and courtesy in responses'),
+    (lambda m: m.frustration_incidents > 2,
+     '- Better understand user intent to reduce frustration'),
+    (lambda m: m.error_rate > 0.1,
+     '- Improve error handling and recovery'),
+)
+
+_RUBRIC_CRITERIA = ('clarity', 'relevance', 'completeness', 'politeness')
+
+# Strict JSON schema for the fused rubric call: one {reason, score} pair per
+# criterion, so parsing is deterministic instead of scraping REASONING:/SCORE:
+_RUBRICS_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'rubric_scores',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                criterion: {
+                    'type': 'object',
+                    'properties': {
+                        'reason': {'type': 'string'},
+                        'score': {'type': 'integer'},
+                    },
+                    'required': ['reason', 'score'],
+                    'additionalProperties': False,
+                }
+                for criterion in _RUBRIC_CRITERIA
+            },
+            'required': list(_RUBRIC_CRITERIA),
+            'additionalProperties': False,
+        },
+    },
+}
+
+
+# Row-marshaled variant: one call scores a whole batch of conversations,
+# returning an ordered array of the per-conversation rubric objects
+_RUBRICS_BATCH_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'rubric_scores_batch',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'results': {
+                    'type': 'array',
+                    'items': _RUBRICS_RESPONSE_FORMAT['json_schema']['schema'],
+                },
+            },
+            'required': ['results'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+
+# Static judge instructions. Each lives in the system message and must stay
+# byte-identical across calls: OpenAI's automatic prompt caching keys on
+# identical leading tokens, so keeping every changing value (goal,
+# conversation) in the user message gets the instruction prefix cached across
+# evaluations, with discounted input tokens and lower time-to-first-token.
+# One precompiled scan replaces the per-call REASONING:/SCORE: string
+# splitting; DOTALL lets the reasoning span multiple lines
+_RUBRIC_RE = re.compile(
+    r'REASONING:\s*(.*?)\s*SCORE:\s*([0-3])',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _parse_rubric(response_text: str, criterion: str) -> Tuple[int, str]:
+    """Parse a REASONING:/SCORE: judge reply into (score, reason)."""
+    match = _RUBRIC_RE.search(response_text)
+    if match is None:
+        print(f"❌ Wrong response format when checking {criterion}: {response_text}")
+        return 1, "Parsing error; defaulting to fair."
+    return int(match.group(2)), match.group(1).strip()
+
+
+# Optional compiled drop-in: a Cython/mypyc build can ship src/_parser with a
+# parse_rubric(text, criterion) that walks the string in C. The regex engine
+# already runs the scan in C, so this only pays off for very large judge
+# outputs; the hook costs nothing when the extension is absent.
+try:
+    from src._parser import parse_rubric as _parse_rubric  # noqa: F811
+except ImportError:
+    pass
+
+
+_FRUSTRATION_PHRASES = (
+    'not what i asked',
+    "that's not helpful",
+    "you're not understanding",
+    'this is frustrating',
+    'can you just',
+    'i already said',
+    'please listen',
+    'wrong answer',
+    "that doesn't help",
+    "this isn't working",
+)
+
+# One compiled alternation scans each message in a single pass instead of a
+# Python loop over phrases; IGNORECASE also drops the per-message .lower() copy
+_FRUSTRATION_RE = re.compile(
+    '|'.join(map(re.escape, _FRUSTRATION_PHRASES)),
+    re.IGNORECASE,
+)
+
+_GOAL_SYSTEM = """Evaluate if the conversation provided by the user achieved its goal.
+
+Context: This is a "Keep in mind" memory assistant that follows a clarification policy:
+- When users ask vague questions about stored memories, the assistant should ask clarifying questions
+- When users ask specific questions, the assistant should search directly
+- The assistant should help users find their stored information through appropriate clarification
+
+Based on the success criteria, was the goal achieved? Consider:
+1. Were all success criteria met?
+2. Did the assistant follow the clarification policy appropriately?
+3. Did the user ultimately get their answer or understand why not?
+4. Was the assistant's behavior appropriate for the query type (vague vs specific)?
+
+Report whether the goal was achieved."""
+
+# Constrained decoding beats generating "TRUE"/"FALSE" prose: the reply is a
+# single schema-guaranteed boolean, immune to stray punctuation or casing
+_GOAL_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'goal_achievement',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'achieved': {'type': 'boolean'},
+            },
+            'required': ['achieved'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+_RUBRICS_SYSTEM = """Evaluate these four aspects of the assistant's responses in the conversation provided by the user. Score each on a 0-3 integer scale and give a short reason.
+
+CLARITY (of the assistant's responses):
+0 - Poor: Responses are confusing, unclear, or incomprehensible. Structure is illogical, instructions are vague.
+1 - Fair: Responses are somewhat clear but have notable issues. Some parts are confusing or poorly structured.
+2 - Good: Responses are mostly clear and well-structured. Minor clarity issues that don't impede understanding.
+3 - Excellent: Responses are crystal clear, well-organized, and easy to follow. Instructions are specific and actionable.
+
+RELEVANCE (to the user's goal):
+0 - Irrelevant: Responses mostly miss the point, contain off-topic content, or fail to address the goal.
+1 - Partially Relevant: Some responses address the goal but with significant tangents or missing key aspects.
+2 - Mostly Relevant: Responses generally stay on topic and address the goal with minor irrelevant content.
+3 - Highly Relevant: All responses directly address the user's questions and goal without unnecessary tangents.
+
+COMPLETENESS (against the success criteria):
+0 - Incomplete: Major aspects missing, provides only surface-level information, fails to meet success criteria.
+1 - Partially Complete: Addresses some aspects but omits important details or steps, meets few success criteria.
+2 - Mostly Complete: Covers most important aspects with adequate depth, meets most success criteria.
+3 - Fully Complete: Thoroughly addresses all aspects with appropriate depth, meets all success criteria.
+
+POLITENESS (of the assistant's tone):
+0 - Impolite: Responses are rude, dismissive, or disrespectful. Uses harsh language or shows impatience.
+1 - Somewhat Polite: Responses are generally polite but may lack warmth or could be more courteous.
+2 - Polite: Responses are consistently polite and respectful with appropriate courtesy.
+3 - Very Polite: Responses are exceptionally courteous, warm, and respectful with excellent tone."""
+
+_RUBRICS_BATCH_SYSTEM = (
+    "Score each of the numbered conversations provided by the user on the four "
+    "aspects below. Score each aspect on a 0-3 integer scale and give a short "
+    "reason. Return one result object per conversation, in the same order as "
+    "the input.\n\n"
+    + _RUBRICS_SYSTEM.split('\n\n', 1)[1]
+)
+
+
+_SCORE_FORMAT = """First provide your reasoning, then give your score.
+Format your response as:
+REASONING: [Your analysis]
+SCORE: [0, 1, 2, or 3]"""
+
+_CLARITY_SYSTEM = """Evaluate the clarity of the assistant responses provided by the user.
+
+Scoring Rubric (0-3):
+0 - Poor: Responses are confusing, unclear, or incomprehensible. Structure is illogical, instructions are vague.
+1 - Fair: Responses are somewhat clear but have notable issues. Some parts are confusing or poorly structured.
+2 - Good: Responses are mostly clear and well-structured. Minor clarity issues that don't impede understanding.
+3 - Excellent: Responses are crystal clear, well-organized, and easy to follow. Instructions are specific and actionable.
+
+Evaluation Criteria:
+- Are explanations clear and easy to understand?
+- Is technical jargon explained when necessary?
+- Are instructions specific and actionable?
+- Is the structure logical and easy to follow?
+
+""" + _SCORE_FORMAT
+
+_RELEVANCE_SYSTEM = """Evaluate the relevance of the assistant's responses to the user's goal.
+
+Scoring Rubric (0-3):
+0 - Irrelevant: Responses mostly miss the point, contain off-topic content, or fail to address the goal.
+1 - Partially Relevant: Some responses address the goal but with significant tangents or missing key aspects.
+2 - Mostly Relevant: Responses generally stay on topic and address the goal with minor irrelevant content.
+3 - Highly Relevant: All responses directly address the user's questions and goal without unnecessary tangents.
+
+Evaluation Criteria:
+- Do responses directly address the user's questions?
+- Is information provided relevant to the goal?
+- Are there unnecessary tangents or off-topic content?
+- Does the assistant stay focused on helping achieve the goal?
+
+""" + _SCORE_FORMAT
+
+_COMPLETENESS_SYSTEM = """Evaluate the completeness of the assistant's responses.
+
+Scoring Rubric (0-3):
+0 - Incomplete: Major aspects missing, provides only surface-level information, fails to meet success criteria.
+1 - Partially Complete: Addresses some aspects but omits important details or steps, meets few success criteria.
+2 - Mostly Complete: Covers most important aspects with adequate depth, meets most success criteria.
+3 - Fully Complete: Thoroughly addresses all aspects with appropriate depth, meets all success criteria.
+
+Evaluation Criteria:
+- Were all aspects of the question addressed?
+- Are responses thorough given the complexity level?
+- Were important details or steps omitted?
+- Did the assistant provide sufficient depth?
+
+""" + _SCORE_FORMAT
+
+_POLITENESS_SYSTEM = """Evaluate the politeness and courtesy of the assistant responses provided by the user.
+
+Scoring Rubric (0-3):
+0 - Impolite: Responses are rude, dismissive, or disrespectful. Uses harsh language or shows impatience.
+1 - Somewhat Polite: Responses are generally polite but may lack warmth or could be more courteous.
+2 - Polite: Responses are consistently polite and respectful with appropriate courtesy.
+3 - Very Polite: Responses are exceptionally courteous, warm, and respectful with excellent tone.
+
+Evaluation Criteria:
+- Does the assistant use polite language and appropriate greetings?
+- Is the tone respectful and considerate?
+- Does the assistant show empathy and understanding?
+- Are responses courteous even when correcting or clarifying?
+- Does the assistant maintain a professional yet friendly demeanor?
+
+""" + _SCORE_FORMAT
+
+
+class _CachedChat:
+    """Content-addressed disk cache around chat.completions.create.
+
+    Judge calls are idempotent enough for development use (temperature
+    default, small completions), so repeated evaluations of the same
+    conversations — common in dev and CI — can reuse the stored response
+    instead of paying API latency and cost again. Keyed by a SHA-256 of the
+    full call kwargs; enabled via ICT_EVAL_CACHE=1.
+    """
+
+    def __init__(self, client: AsyncOpenAI):
+        self._create = client.chat.completions.create
+        self._cache = diskcache.Cache(
+            os.path.expanduser('~/.cache/ict_assistant_eval')
+        )
+
+    async def create(self, **kwargs):
+        key = hashlib.sha256(
+            orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return ChatCompletion.model_validate(cached)
+        response = await self._create(**kwargs)
+        self._cache.set(key, response.model_dump())
+        return response
+
+
+def _maybe_cached(client: AsyncOpenAI):
+    """Wrap the client's completions in the disk cache when enabled."""
+    if os.getenv('ICT_EVAL_CACHE') != '1':
+        return client
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=_CachedChat(client))
+    )
+
 
 class ConversationEvaluator:
     """
@@ -23,11 +348,35 @@ class ConversationEvaluator:
 
     Scores are normalized to 0-1 floats for metrics compatibility.
     """
-    def __init__(self, openai_api_key: str, model: str = 'gpt-4o'):
-        self.client = OpenAI(api_key=openai_api_key)
+    def __init__(
+        self,
+        openai_api_key: str,
+        model: str = 'gpt-4o',
+        judge_model: str = 'gpt-4o-mini',
+        goal_model: Optional[str] = None,
+    ):
+        self.client = _maybe_cached(AsyncOpenAI(api_key=openai_api_key))
         self.model = model
+        # Rubric scoring is a bounded task well within the mini model's
+        # capability at a fraction of the cost and latency; goal achievement
+        # keeps the stronger model (the run model unless overridden)
+        self.judge_model = judge_model
+        self.goal_model = goal_model or model
+
+    def evaluate_sync(
+        self,
+        conversation: ConversationState,
+        goal: ConversationGoal,
+        persona: UserPersona,
+        response_times: List[float],
+        errors: List[str]
+    ) -> EvaluationMetrics:
+        """Blocking wrapper around evaluate for synchronous callers."""
+        return asyncio.run(
+            self.evaluate(conversation, goal, persona, response_times, errors)
+        )
 
-    def evaluate(
+    async def evaluate(
         self,
         conversation: ConversationState,
         goal: ConversationGoal,
@@ -37,15 +386,51 @@ class ConversationEvaluator:
     ) -> EvaluationMetrics:
         """Evaluate a completed conversation.
 
-        Uses 0-3 integer scoring internally, normalized to 0-1 floats for metrics.
+        Uses 0-3 integer scoring internally, normalized to 0-1 floats for
+        metrics. The five judge calls are independent and I/O-bound, so they
+        run concurrently; wall time is the slowest call rather than the sum.
         """
-        goal_achieved = self._evaluate_goal_achievement(conversation, goal)
+        # Render the transcript variants once and share them across the judge
+        # calls instead of rebuilding them in every helper
+        full_text = '\n\n'.join(
+            f"{msg.role}: {msg.content}"
+            for msg in conversation.messages
+        )
+        assistant_text = '\n\n'.join(
+            msg.content
+            for msg in conversation.messages
+            if msg.role == 'assistant'
+        )
 
-        # Get integer scores (0-3) and reasons, then normalize to 0-1 floats
-        clarity_score_int, clarity_reason = self._evaluate_clarity(conversation)
-        relevance_score_int, relevance_reason = self._evaluate_relevance(conversation, goal)
-        completeness_score_int, completeness_reason = self._evaluate_completeness(conversation, goal)
-        politeness_score_int, politeness_reason = self._evaluate_politeness(conversation)
+        # A conversation with no assistant turns cannot meaningfully score;
+        # return defaults without paying for any judge calls (common in
+        # sweeps with many short or failed simulations)
+        if not assistant_text:
+            return EvaluationMetrics(
+                goal_achieved=False,
+                total_turns=conversation.current_turn,
+                average_response_time=(
+                    sum(response_times) / len(response_times)
+                    if response_times else 0
+                ),
+                user_satisfaction_score=conversation.user_satisfaction,
+                clarity_score=1 / 3.0,
+                clarity_reason="No assistant messages; defaulting to fair.",
+                relevance_score=1 / 3.0,
+                completeness_score=1 / 3.0,
+                politeness_score=1 / 3.0,
+                frustration_incidents=self._count_frustration_incidents(conversation),
+                error_rate=len(errors) / max(len(conversation.messages), 1),
+            )
+
+        goal_achieved, rubrics = await asyncio.gather(
+            self._evaluate_goal_achievement(goal, full_text),
+            self._evaluate_all_rubrics(goal, full_text, assistant_text),
+        )
+        clarity_score_int, clarity_reason = rubrics['clarity']
+        relevance_score_int, relevance_reason = rubrics['relevance']
+        completeness_score_int, completeness_reason = rubrics['completeness']
+        politeness_score_int, politeness_reason = rubrics['politeness']
 
         # Normalize integer scores (0-3) to float scores (0-1)
         clarity_score = clarity_score_int / 3.0
@@ -78,310 +463,291 @@ class ConversationEvaluator:
             error_rate=error_rate,
         )
 
-    def _evaluate_goal_achievement(
+    async def evaluate_many(
         self,
-        conversation: ConversationState,
-        goal: ConversationGoal
-    ) -> bool:
-        """Evaluate if the conversation achieved its goal."""
-        conversation_text = '\n\n'.join(
-            f"{msg.role}: {msg.content}"
-            for msg in conversation.messages
-        )
-
-        prompt = f"""Evaluate if the following conversation achieved its goal.
-
-        Context: This is a "Keep in mind" memory assistant that follows a clarification policy:
-        - When users ask vague questions about stored memories, the assistant should ask clarifying questions
-        - When users ask specific questions, the assistant should search directly
-        - The assistant should help users find their stored information through appropriate clarification
-
-        Goal: {goal.description}
-
-        Success Criteria:
-        {chr(10).join(f'- {c}' for c in goal.success_criteria)}
-
-        Conversation:
-        {conversation_text}
+        items: List[Tuple[ConversationState, ConversationGoal, UserPersona, List[float], List[str]]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[EvaluationMetrics]:
+        """Evaluate many conversations concurrently under a semaphore.
+
+        items holds the evaluate() argument tuples. Concurrency defaults to 8
+        (override via the ICT_EVAL_CONCURRENCY env var) to stay inside OpenAI
+        rate limits; each evaluation already fans out its own judge calls, so
+        the effective request parallelism is a small multiple of this.
+        """
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('ICT_EVAL_CONCURRENCY', '8'))
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        Based on the success criteria, was the goal achieved? Consider:
-        1. Were all success criteria met?
-        2. Did the assistant follow the clarification policy appropriately?
-        3. Did the user ultimately get their answer or understand why not?
-        4. Was the assistant's behavior appropriate for the query type (vague vs specific)?
+        async def bounded(item):
+            async with semaphore:
+                return await self.evaluate(*item)
 
-        Respond with only "TRUE" if the goal was achieved, or "FALSE" if not."""
+        return list(await asyncio.gather(*(bounded(item) for item in items)))
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{'role': 'user', 'content': prompt}],
-            max_completion_tokens=10,
+    async def _judge(
+        self,
+        model: str,
+        system: str,
+        user_content: str,
+        max_tokens: int,
+        response_format: Optional[Dict] = None,
+    ):
+        """Issue a judge call with deterministic sampling.
+
+        temperature=0 and a fixed seed keep repeated scoring of the same
+        conversation stable, which cuts rubric variance (fewer simulations
+        needed per confidence interval) and makes the responses cacheable.
+        """
+        kwargs = dict(
+            model=model,
+            messages=[
+                {'role': 'system', 'content': system},
+                {'role': 'user', 'content': user_content},
+            ],
+            max_completion_tokens=max_tokens,
+            temperature=0,
+            seed=42,
         )
+        if response_format is not None:
+            kwargs['response_format'] = response_format
+        return await self.client.chat.completions.create(**kwargs)
 
-        result = response.choices[0].message.content.upper().strip()
-        return result == 'TRUE'
-
-    def _evaluate_clarity(self, conversation: ConversationState) -> Tuple[int, str]:
-        """Evaluate the clarity of assistant responses using 0-3 integer scale and return reason."""
-        assistant_messages = '\n\n'.join(
-            msg.content
-            for msg in conversation.messages
-            if msg.role == 'assistant'
-        )
+    async def _evaluate_goal_achievement(
+        self,
+        goal: ConversationGoal,
+        conversation_text: str
+    ) -> bool:
+        """Evaluate if the conversation achieved its goal."""
+        user_content = f"""Goal: {goal.description}
 
-        if not assistant_messages:
-            return 1, "No assistant messages; defaulting to fair."
+Success Criteria:
+{chr(10).join(f'- {c}' for c in goal.success_criteria)}
 
-        prompt = f"""Evaluate the clarity of these assistant responses.
+Conversation:
+{conversation_text}"""
 
-        Assistant Messages:
-        {assistant_messages}
+        response = await self._judge(
+            self.goal_model, _GOAL_SYSTEM, user_content, 10,
+            response_format=_GOAL_RESPONSE_FORMAT,
+        )
 
-        Scoring Rubric (0-3):
-        0 - Poor: Responses are confusing, unclear, or incomprehensible. Structure is illogical, instructions are vague.
-        1 - Fair: Responses are somewhat clear but have notable issues. Some parts are confusing or poorly structured.
-        2 - Good: Responses are mostly clear and well-structured. Minor clarity issues that don't impede understanding.
-        3 - Excellent: Responses are crystal clear, well-organized, and easy to follow. Instructions are specific and actionable.
+        content = response.choices[0].message.content
+        try:
+            return bool(orjson.loads(content)['achieved'])
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            # Model ignored the schema; fall back to the old string compare
+            return content.upper().strip() == 'TRUE'
 
-        Evaluation Criteria:
-        - Are explanations clear and easy to understand?
-        - Is technical jargon explained when necessary?
-        - Are instructions specific and actionable?
-        - Is the structure logical and easy to follow?
+    async def _evaluate_all_rubrics(
+        self,
+        goal: ConversationGoal,
+        conversation_text: str,
+        assistant_text: str
+    ) -> Dict[str, Tuple[int, str]]:
+        """Score all four rubrics in one judge call.
+
+        The conversation text dominates prompt size, and the per-criterion
+        calls each resent it with a different rubric. Fusing them shares one
+        copy of the conversation and one network round trip; the JSON-schema
+        response format makes the result parseable without string scraping.
+        Falls back to the per-criterion calls if the fused reply is unusable.
+        """
+        user_content = f"""User's Goal: {goal.description}
+Domain: {goal.domain}
+Expected Complexity: {goal.complexity}
 
-        First provide your reasoning, then give your score.
-        Format your response as:
-        REASONING: [Your analysis]
-        SCORE: [0, 1, 2, or 3]"""
+Success Criteria:
+{chr(10).join(f'- {c}' for c in goal.success_criteria)}
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{'role': 'user', 'content': prompt}],
-            max_completion_tokens=300,
-        )
+Conversation:
+{conversation_text}"""
 
         try:
-            response_text = response.choices[0].message.content
-            # Extract reason between REASONING: and SCORE:
-            reason_text = ""
-            if 'REASONING:' in response_text and 'SCORE:' in response_text:
-                try:
-                    reason_text = response_text.split('REASONING:')[1].split('SCORE:')[0].strip()
-                except Exception:
-                    # Fallback to single-line extraction
-                    reason_line = [line for line in response_text.split('\n') if 'REASONING:' in line][0]
-                    reason_text = reason_line.split('REASONING:')[1].strip()
-            else:                
-                print(f"❌ Wrong response format when checking clarity: {response_text}")
-            score_line = [line for line in response_text.split('\n') if 'SCORE:' in line][0]
-            score = int(score_line.split('SCORE:')[1].strip())
-            return max(0, min(3, score)), reason_text
-        except (ValueError, IndexError):
-            return 1, "Parsing error; defaulting to fair."
-
-    def _evaluate_relevance(
+            response = await self._judge(
+                self.judge_model, _RUBRICS_SYSTEM, user_content, 600,
+                response_format=_RUBRICS_RESPONSE_FORMAT,
+            )
+            parsed = orjson.loads(response.choices[0].message.content)
+            return {
+                criterion: (
+                    max(0, min(3, int(parsed[criterion]['score']))),
+                    str(parsed[criterion]['reason']),
+                )
+                for criterion in _RUBRIC_CRITERIA
+            }
+        except Exception:
+            # Fused call failed (schema unsupported, malformed reply, ...);
+            # fall back to the slower per-criterion calls
+            clarity, relevance, completeness, politeness = await asyncio.gather(
+                self._evaluate_clarity(assistant_text),
+                self._evaluate_relevance(goal, conversation_text),
+                self._evaluate_completeness(goal, conversation_text),
+                self._evaluate_politeness(assistant_text),
+            )
+            return {
+                'clarity': clarity,
+                'relevance': relevance,
+                'completeness': completeness,
+                'politeness': politeness,
+            }
+
+    async def batch_evaluate(
         self,
-        conversation: ConversationState,
-        goal: ConversationGoal
-    ) -> Tuple[int, str]:
-        """Evaluate relevance using 0-3 integer scale and return reason."""
-        conversation_text = '\n\n'.join(
-            f"{msg.role}: {msg.content}"
-            for msg in conversation.messages
-        )
-
-        prompt = f"""Evaluate the relevance of the assistant's responses to the user's goal.
+        items: List[Tuple[ConversationState, ConversationGoal]],
+        batch_size: int = 4,
+        max_concurrency: int = 4,
+    ) -> List[Dict[str, Tuple[int, str]]]:
+        """Score the rubrics for many conversations with one call per batch.
+
+        Packs batch_size conversations into a single judge prompt returning an
+        ordered JSON array of score sets, so K conversations consume one
+        request-per-minute slot instead of K. Batches run concurrently under a
+        semaphore. Returns one rubric dict per item, aligned with the input.
+        """
+        batches = [
+            items[i:i + batch_size]
+            for i in range(0, len(items), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        User's Goal: {goal.description}
-        Domain: {goal.domain}
+        async def score(batch):
+            async with semaphore:
+                return await self._evaluate_rubrics_batch(batch)
 
-        Conversation:
-        {conversation_text}
+        scored = await asyncio.gather(*(score(batch) for batch in batches))
+        return [rubrics for batch in scored for rubrics in batch]
 
-        Scoring Rubric (0-3):
-        0 - Irrelevant: Responses mostly miss the point, contain off-topic content, or fail to address the goal.
-        1 - Partially Relevant: Some responses address the goal but with significant tangents or missing key aspects.
-        2 - Mostly Relevant: Responses generally stay on topic and address the goal with minor irrelevant content.
-        3 - Highly Relevant: All responses directly address the user's questions and goal without unnecessary tangents.
+    async def _evaluate_rubrics_batch(
+        self,
+        batch: List[Tuple[ConversationState, ConversationGoal]]
+    ) -> List[Dict[str, Tuple[int, str]]]:
+        """Score one batch of conversations in a single judge call."""
+        sections = []
+        for k, (conversation, goal) in enumerate(batch):
+            conversation_text = '\n\n'.join(
+                f"{msg.role}: {msg.content}"
+                for msg in conversation.messages
+            )
+            sections.append(
+                f"### CONVERSATION {k}\n"
+                f"User's Goal: {goal.description}\n"
+                f"Domain: {goal.domain}\n\n"
+                f"{conversation_text}"
+            )
 
-        Evaluation Criteria:
-        - Do responses directly address the user's questions?
-        - Is information provided relevant to the goal?
-        - Are there unnecessary tangents or off-topic content?
-        - Does the assistant stay focused on helping achieve the goal?
+        try:
+            response = await self._judge(
+                self.judge_model, _RUBRICS_BATCH_SYSTEM,
+                '\n\n'.join(sections), 600 * len(batch),
+                response_format=_RUBRICS_BATCH_RESPONSE_FORMAT,
+            )
+            rows = orjson.loads(response.choices[0].message.content)['results']
+            if len(rows) != len(batch):
+                raise ValueError(
+                    f"expected {len(batch)} rubric rows, got {len(rows)}"
+                )
+            return [
+                {
+                    criterion: (
+                        max(0, min(3, int(row[criterion]['score']))),
+                        str(row[criterion]['reason']),
+                    )
+                    for criterion in _RUBRIC_CRITERIA
+                }
+                for row in rows
+            ]
+        except Exception:
+            # Row count mismatch or schema failure; score each conversation
+            # with its own fused call instead
+            return await asyncio.gather(*(
+                self._evaluate_all_rubrics(
+                    goal,
+                    '\n\n'.join(
+                        f"{msg.role}: {msg.content}"
+                        for msg in conversation.messages
+                    ),
+                    '\n\n'.join(
+                        msg.content
+                        for msg in conversation.messages
+                        if msg.role == 'assistant'
+                    ),
+                )
+                for conversation, goal in batch
+            ))
+
+    async def _evaluate_clarity(self, assistant_text: str) -> Tuple[int, str]:
+        """Evaluate the clarity of assistant responses using 0-3 integer scale and return reason."""
+        if not assistant_text:
+            return 1, "No assistant messages; defaulting to fair."
 
-        First provide your reasoning, then give your score.
-        Format your response as:
-        REASONING: [Your analysis]
-        SCORE: [0, 1, 2, or 3]"""
+        user_content = f"Assistant Messages:\n{assistant_text}"
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{'role': 'user', 'content': prompt}],
-            max_completion_tokens=300,
+        response = await self._judge(
+            self.judge_model, _CLARITY_SYSTEM, user_content, 300,
         )
 
-        try:
-            response_text = response.choices[0].message.content
-            reason_text = ""
-            if 'REASONING:' in response_text and 'SCORE:' in response_text:
-                try:
-                    reason_text = response_text.split('REASONING:')[1].split('SCORE:')[0].strip()
-                except Exception:
-                    reason_line = [line for line in response_text.split('\n') if 'REASONING:' in line][0]
-                    reason_text = reason_line.split('REASONING:')[1].strip()
-            else:
-                print(f"❌ Wrong response format when checking relevance: {response_text}")
-            score_line = [line for line in response_text.split('\n') if 'SCORE:' in line][0]
-            score = int(score_line.split('SCORE:')[1].strip())
-            return max(0, min(3, score)), reason_text
-        except (ValueError, IndexError):
-            return 1, "Parsing error; defaulting to fair."
-
-    def _evaluate_completeness(
+        return _parse_rubric(response.choices[0].message.content, 'clarity')
+
+    async def _evaluate_relevance(
         self,
-        conversation: ConversationState,
-        goal: ConversationGoal
+        goal: ConversationGoal,
+        conversation_text: str
     ) -> Tuple[int, str]:
-        """Evaluate completeness using 0-3 integer scale and return reason."""
-        conversation_text = '\n\n'.join(
-            f"{msg.role}: {msg.content}"
-            for msg in conversation.messages
-        )
-
-        prompt = f"""Evaluate the completeness of the assistant's responses.
+        """Evaluate relevance using 0-3 integer scale and return reason."""
+        user_content = f"""User's Goal: {goal.description}
+Domain: {goal.domain}
 
-        Goal: {goal.description}
-        Expected Complexity: {goal.complexity}
+Conversation:
+{conversation_text}"""
 
-        Success Criteria:
-        {chr(10).join(f'- {c}' for c in goal.success_criteria)}
+        response = await self._judge(
+            self.judge_model, _RELEVANCE_SYSTEM, user_content, 300,
+        )
 
-        Conversation:
-        {conversation_text}
+        return _parse_rubric(response.choices[0].message.content, 'relevance')
 
-        Scoring Rubric (0-3):
-        0 - Incomplete: Major aspects missing, provides only surface-level information, fails to meet success criteria.
-        1 - Partially Complete: Addresses some aspects but omits important details or steps, meets few success criteria.
-        2 - Mostly Complete: Covers most important aspects with adequate depth, meets most success criteria.
-        3 - Fully Complete: Thoroughly addresses all aspects with appropriate depth, meets all success criteria.
+    async def _evaluate_completeness(
+        self,
+        goal: ConversationGoal,
+        conversation_text: str
+    ) -> Tuple[int, str]:
+        """Evaluate completeness using 0-3 integer scale and return reason."""
+        user_content = f"""Goal: {goal.description}
+Expected Complexity: {goal.complexity}
 
-        Evaluation Criteria:
-        - Were all aspects of the question addressed?
-        - Are responses thorough given the complexity level?
-        - Were important details or steps omitted?
-        - Did the assistant provide sufficient depth?
+Success Criteria:
+{chr(10).join(f'- {c}' for c in goal.success_criteria)}
 
-        First provide your reasoning, then give your score.
-        Format your response as:
-        REASONING: [Your analysis]
-        SCORE: [0, 1, 2, or 3]"""
+Conversation:
+{conversation_text}"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{'role': 'user', 'content': prompt}],
-            max_completion_tokens=300,
+        response = await self._judge(
+            self.judge_model, _COMPLETENESS_SYSTEM, user_content, 300,
         )
 
-        try:
-            response_text = response.choices[0].message.content
-            reason_text = ""
-            if 'REASONING:' in response_text and 'SCORE:' in response_text:
-                try:
-                    reason_text = response_text.split('REASONING:')[1].split('SCORE:')[0].strip()
-                except Exception:
-                    reason_line = [line for line in response_text.split('\n') if 'REASONING:' in line][0]
-                    reason_text = reason_line.split('REASONING:')[1].strip()
-            else:
-                print(f"❌ Wrong response format when checking completeness: {response_text}")
-            score_line = [line for line in response_text.split('\n') if 'SCORE:' in line][0]
-            score = int(score_line.split('SCORE:')[1].strip())
-            return max(0, min(3, score)), reason_text
-        except (ValueError, IndexError):
-            return 1, "Parsing error; defaulting to fair."
-
-    def _evaluate_politeness(self, conversation: ConversationState) -> Tuple[int, str]:
-        """Evaluate politeness using 0-3 integer scale and return reason."""
-        assistant_messages = '\n\n'.join(
-            msg.content
-            for msg in conversation.messages
-            if msg.role == 'assistant'
-        )
+        return _parse_rubric(response.choices[0].message.content, 'completeness')
 
-        if not assistant_messages:
+    async def _evaluate_politeness(self, assistant_text: str) -> Tuple[int, str]:
+        """Evaluate politeness using 0-3 integer scale and return reason."""
+        if not assistant_text:
             return 1, "No assistant messages; defaulting to fair."
 
-        prompt = f"""Evaluate the politeness and courtesy of these assistant responses.
-
-        Assistant Messages:
-        {assistant_messages}
-
-        Scoring Rubric (0-3):
-        0 - Impolite: Responses are rude, dismissive, or disrespectful. Uses harsh language or shows impatience.
-        1 - Somewhat Polite: Responses are generally polite but may lack warmth or could be more courteous.
-        2 - Polite: Responses are consistently polite and respectful with appropriate courtesy.
-        3 - Very Polite: Responses are exceptionally courteous, warm, and respectful with excellent tone.
-
-        Evaluation Criteria:
-        - Does the assistant use polite language and appropriate greetings?
-        - Is the tone respectful and considerate?
-        - Does the assistant show empathy and understanding?
-        - Are responses courteous even when correcting or clarifying?
-        - Does the assistant maintain a professional yet friendly demeanor?
-
-        First provide your reasoning, then give your score.
-        Format your response as:
-        REASONING: [Your analysis]
-        SCORE: [0, 1, 2, or 3]"""
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{'role': 'user', 'content': prompt}],
-            max_completion_tokens=300,
+        user_content = f"Assistant Messages:\n{assistant_text}"
+
+        response = await self._judge(
+            self.judge_model, _POLITENESS_SYSTEM, user_content, 300,
         )
 
-        try:
-            response_text = response.choices[0].message.content
-            reason_text = ""
-            if 'REASONING:' in response_text and 'SCORE:' in response_text:
-                try:
-                    reason_text = response_text.split('REASONING:')[1].split('SCORE:')[0].strip()
-                except Exception:
-                    reason_line = [line for line in response_text.split('\n') if 'REASONING:' in line][0]
-                    reason_text = reason_line.split('REASONING:')[1].strip()
-            else:
-                print(f"❌ Wrong response format when checking politeness: {response_text}")
-            score_line = [line for line in response_text.split('\n') if 'SCORE:' in line][0]
-            score = int(score_line.split('SCORE:')[1].strip())
-            return max(0, min(3, score)), reason_text
-        except (ValueError, IndexError):
-            return 1, "Parsing error; defaulting to fair."
+        return _parse_rubric(response.choices[0].message.content, 'politeness')
 
     def _count_frustration_incidents(self, conversation: ConversationState) -> int:
-        """Count frustration incidents in user messages."""
-        incidents = 0
-        frustration_phrases = [
-            'not what i asked',
-            "that's not helpful",
-            "you're not understanding",
-            'this is frustrating',
-            'can you just',
-            'i already said',
-            'please listen',
-            'wrong answer',
-            "that doesn't help",
-            "this isn't working",
-        ]
-
-        for message in conversation.messages:
-            if message.role == 'user':
-                lower_content = message.content.lower()
-                for phrase in frustration_phrases:
-                    if phrase in lower_content:
-                        incidents += 1
-                        break
-
-        return incidents
+        """Count user messages containing a frustration phrase."""
+        return sum(
+            1
+            for message in conversation.messages
+            if message.role == 'user' and _FRUSTRATION_RE.search(message.content)
+        )
 
     def generate_report(self, metrics: EvaluationMetrics) -> str:
         """Generate a human-readable evaluation report.
@@ -389,111 +755,74 @@ class ConversationEvaluator:
         Displays both normalized percentages and original 0-3 scale ratings.
         """
         overall_score = self._calculate_overall_score(metrics)
-
-        # Convert normalized scores back to 0-3 scale for display
-        clarity_rating = round(metrics.clarity_score * 3)
-        relevance_rating = round(metrics.relevance_score * 3)
-        completeness_rating = round(metrics.completeness_score * 3)
-        politeness_rating = round(metrics.politeness_score * 3)
-        satisfaction_rating = round(metrics.user_satisfaction_score * 3)
-
-        report = f"""
-=== EVALUATION REPORT ===
-
-Overall Score: {overall_score * 100:.1f}% {self._get_grade(overall_score)}
-
-Goal Achievement: {'✓ Achieved' if metrics.goal_achieved else '✗ Not Achieved'}
-
-Performance Metrics:
-- Total Turns: {metrics.total_turns}
-- Avg Response Time: {metrics.average_response_time / 1000:.2f}s
-- Error Rate: {metrics.error_rate * 100:.1f}%
-
-Quality Scores (0-3 scale | percentage):
-- User Satisfaction: {satisfaction_rating}/3 ({metrics.user_satisfaction_score * 100:.1f}%)
-- Clarity: {clarity_rating}/3 ({metrics.clarity_score * 100:.1f}%)
-  {('Reason: ' + metrics.clarity_reason) if getattr(metrics, 'clarity_reason', None) else ''}
-- Relevance: {relevance_rating}/3 ({metrics.relevance_score * 100:.1f}%)
-  {('Reason: ' + metrics.relevance_reason) if getattr(metrics, 'relevance_reason', None) else ''}
-- Completeness: {completeness_rating}/3 ({metrics.completeness_score * 100:.1f}%)
-  {('Reason: ' + metrics.completeness_reason) if getattr(metrics, 'completeness_reason', None) else ''}
-- Politeness: {politeness_rating}/3 ({metrics.politeness_score * 100:.1f}%)
-  {('Reason: ' + metrics.politeness_reason) if getattr(metrics, 'politeness_reason', None) else ''}
-
-Score Interpretation:
-  0 = Poor | 1 = Fair | 2 = Good | 3 = Excellent
-
-Issues:
-- Frustration Incidents: {metrics.frustration_incidents}
-
-{self._generate_recommendations(metrics)}
-"""
-        return report
+        grade = self._get_grade(overall_score)
+        recommendations = self._generate_recommendations(metrics)
+
+        # Assemble as a list of lines with one final join; the optional
+        # Reason lines become explicit appends instead of inline conditionals
+        lines = [
+            '',
+            '=== EVALUATION REPORT ===',
+            '',
+            f"Overall Score: {overall_score * 100:.1f}% {grade}",
+            '',
+            f"Goal Achievement: {'✓ Achieved' if metrics.goal_achieved else '✗ Not Achieved'}",
+            '',
+            'Performance Metrics:',
+            f"- Total Turns: {metrics.total_turns}",
+            f"- Avg Response Time: {metrics.average_response_time / 1000:.2f}s",
+            f"- Error Rate: {metrics.error_rate * 100:.1f}%",
+            '',
+            'Quality Scores (0-3 scale | percentage):',
+            f"- User Satisfaction: {round(metrics.user_satisfaction_score * 3)}/3 ({metrics.user_satisfaction_score * 100:.1f}%)",
+        ]
+        for label, score, reason in (
+            ('Clarity', metrics.clarity_score, metrics.clarity_reason),
+            ('Relevance', metrics.relevance_score, metrics.relevance_reason),
+            ('Completeness', metrics.completeness_score, metrics.completeness_reason),
+            ('Politeness', metrics.politeness_score, metrics.politeness_reason),
+        ):
+            lines.append(f"- {label}: {round(score * 3)}/3 ({score * 100:.1f}%)")
+            if reason:
+                lines.append(f"  Reason: {reason}")
+        lines += [
+            '',
+            'Score Interpretation:',
+            '  0 = Poor | 1 = Fair | 2 = Good | 3 = Excellent',
+            '',
+            'Issues:',
+            f"- Frustration Incidents: {metrics.frustration_incidents}",
+            '',
+            recommendations,
+            '',
+        ]
+        return '\n'.join(lines)
 
     def _calculate_overall_score(self, metrics: EvaluationMetrics) -> float:
         """Calculate an overall score from individual metrics."""
-        weights = {
-            'goal_achieved': 0.25,
-            'user_satisfaction': 0.15,
-            'clarity': 0.15,
-            'relevance': 0.20,
-            'completeness': 0.15,
-            'politeness': 0.05,
-            'error_penalty': 0.05,
-        }
-
-        score = 0
-        score += weights['goal_achieved'] if metrics.goal_achieved else 0
-        score += metrics.user_satisfaction_score * weights['user_satisfaction']
-        score += metrics.clarity_score * weights['clarity']
-        score += metrics.relevance_score * weights['relevance']
-        score += metrics.completeness_score * weights['completeness']
-        score += metrics.politeness_score * weights['politeness']
-        score -= metrics.error_rate * weights['error_penalty']
-
-        score -= metrics.frustration_incidents * 0.02
-
-        return max(0, min(1, score))
+        values = np.array([
+            float(metrics.goal_achieved),
+            metrics.user_satisfaction_score,
+            metrics.clarity_score,
+            metrics.relevance_score,
+            metrics.completeness_score,
+            metrics.politeness_score,
+            metrics.error_rate,
+            float(metrics.frustration_incidents),
+        ])
+        return float(np.clip(_SCORE_WEIGHTS @ values, 0.0, 1.0))
 
     def _get_grade(self, score: float) -> str:
         """Convert score to a letter grade."""
-        # Adjusted thresholds for 0-3 scale normalized to 0-1
-        if score >= 0.83:  # ~2.5/3
-            return '(Excellent)'
-        elif score >= 0.67:  # ~2/3
-            return '(Good)'
-        elif score >= 0.5:  # ~1.5/3
-            return '(Satisfactory)'
-        elif score >= 0.33:  # ~1/3
-            return '(Needs Improvement)'
-        else:
-            return '(Poor)'
+        return _GRADE_LABELS[bisect.bisect_right(_GRADE_CUTS, score)]
 
     def _generate_recommendations(self, metrics: EvaluationMetrics) -> str:
         """Generate recommendations based on evaluation metrics."""
-        recommendations = []
-
-        if not metrics.goal_achieved:
-            recommendations.append('- Focus on achieving user goals more effectively')
-
-        # Using 2/3 threshold (equivalent to score of 2 out of 3)
-        if metrics.clarity_score < 0.67:
-            recommendations.append('- Improve response clarity and structure')
-
-        if metrics.relevance_score < 0.67:
-            recommendations.append('- Stay more focused on user questions')
-
-        if metrics.completeness_score < 0.67:
-            recommendations.append('- Provide more comprehensive responses')
-
-        if metrics.politeness_score < 0.67:
-            recommendations.append('- Improve politeness and courtesy in responses')
-
-        if metrics.frustration_incidents > 2:
-            recommendations.append('- Better understand user intent to reduce frustration')
-
-        if metrics.error_rate > 0.1:
-            recommendations.append('- Improve error handling and recovery')
+        recommendations = [
+            message
+            for predicate, message in _RECOMMENDATION_RULES
+            if predicate(metrics)
+        ]
 
         if not recommendations:
             recommendations.append('- Continue maintaining high performance')
@@ -513,32 +842,37 @@ Issues:
         if not metrics_list:
             raise ValueError("Cannot aggregate empty metrics list")
 
-        n = len(metrics_list)
-
-        # Calculate averages
-        goal_achieved_rate = sum(m.goal_achieved for m in metrics_list) / n
-        avg_turns = sum(m.total_turns for m in metrics_list) / n
-        avg_response_time = sum(m.average_response_time for m in metrics_list) / n
-        avg_satisfaction = sum(m.user_satisfaction_score for m in metrics_list) / n
-        avg_clarity = sum(m.clarity_score for m in metrics_list) / n
-        avg_relevance = sum(m.relevance_score for m in metrics_list) / n
-        avg_completeness = sum(m.completeness_score for m in metrics_list) / n
-        avg_politeness = sum(m.politeness_score for m in metrics_list) / n
-        total_frustration = sum(m.frustration_incidents for m in metrics_list)
-        avg_error_rate = sum(m.error_rate for m in metrics_list) / n
+        # One (N, 10) matrix and a single mean(axis=0) replaces ten separate
+        # Python-level sum() passes over the list
+        arr = np.array([
+            (
+                m.goal_achieved,
+                m.total_turns,
+                m.average_response_time,
+                m.user_satisfaction_score,
+                m.clarity_score,
+                m.relevance_score,
+                m.completeness_score,
+                m.politeness_score,
+                m.frustration_incidents,
+                m.error_rate,
+            )
+            for m in metrics_list
+        ], dtype=np.float64)
+        means = arr.mean(axis=0)
 
         # Return aggregated metrics
         return EvaluationMetrics(
-            goal_achieved=goal_achieved_rate >= 0.5,  # Majority achieved
-            total_turns=round(avg_turns),
-            average_response_time=avg_response_time,
-            user_satisfaction_score=avg_satisfaction,
-            clarity_score=avg_clarity,
-            relevance_score=avg_relevance,
-            completeness_score=avg_completeness,
-            politeness_score=avg_politeness,
-            frustration_incidents=round(total_frustration / n),
-            error_rate=avg_error_rate,
+            goal_achieved=means[0] >= 0.5,  # Majority achieved
+            total_turns=round(means[1]),
+            average_response_time=means[2],
+            user_satisfaction_score=means[3],
+            clarity_score=means[4],
+            relevance_score=means[5],
+            completeness_score=means[6],
+            politeness_score=means[7],
+            frustration_incidents=round(means[8]),
+            error_rate=means[9],
         )
 
     def generate_aggregated_report(
@@ -558,6 +892,18 @@ Issues:
         aggregated = self.aggregate_metrics(metrics_list)
         goal_achievement_rate = sum(m.goal_achieved for m in metrics_list) / len(metrics_list) * 100
 
+        # One (N, 4) matrix of rounded 0-3 scores yields all four
+        # distributions; each column is histogrammed with a single bincount
+        # instead of re-iterating the list per attribute
+        score_matrix = np.rint(np.array([
+            (m.clarity_score, m.relevance_score, m.completeness_score, m.politeness_score)
+            for m in metrics_list
+        ]) * 3).astype(np.int64)
+        clarity_dist, relevance_dist, completeness_dist, politeness_dist = (
+            self._format_score_distribution(score_matrix[:, j])
+            for j in range(4)
+        )
+
         report = f"""
 === AGGREGATED EVALUATION REPORT ===
 Simulations Run: {num_simulations}
@@ -568,22 +914,19 @@ Successful Evaluations: {len(metrics_list)}
 Goal Achievement Rate: {goal_achievement_rate:.1f}%
 
 Individual Score Distribution (0-3 scale):
-- Clarity: {self._get_score_distribution(metrics_list, 'clarity_score')}
-- Relevance: {self._get_score_distribution(metrics_list, 'relevance_score')}
-- Completeness: {self._get_score_distribution(metrics_list, 'completeness_score')}
-- Politeness: {self._get_score_distribution(metrics_list, 'politeness_score')}
+- Clarity: {clarity_dist}
+- Relevance: {relevance_dist}
+- Completeness: {completeness_dist}
+- Politeness: {politeness_dist}
 """
         return report
 
-    def _get_score_distribution(self, metrics_list: List[EvaluationMetrics], score_attr: str) -> str:
-        """Get distribution of scores for a specific attribute."""
-        scores = [round(getattr(m, score_attr) * 3) for m in metrics_list]
-        distribution = {0: 0, 1: 0, 2: 0, 3: 0}
-        for score in scores:
-            distribution[score] += 1
-
+    @staticmethod
+    def _format_score_distribution(scores: np.ndarray) -> str:
+        """Format a column of rounded 0-3 scores as a distribution string."""
+        counts = np.bincount(scores, minlength=4)
         total = len(scores)
-        return " | ".join([
+        return " | ".join(
             f"{score}: {count} ({count/total*100:.0f}%)"
-            for score, count in distribution.items()
-        ])
\ No newline at end of file
+            for score, count in enumerate(counts)
+        )
\ No newline at end of file
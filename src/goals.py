@@ -1,3 +1,4 @@
+import uuid
 from typing import Dict
 from src.types import ConversationGoal
 
@@ -62,13 +63,18 @@ PREDEFINED_GOALS: Dict[str, ConversationGoal] = {
 }
 
 
+# Dumped once at module load: model_dump walks the model and allocates a new
+# dict on every call, which is pure waste for batch callers
+_BASE_GOAL_DUMP = PREDEFINED_GOALS['learn_basic_concept'].model_dump()
+
+
 def create_custom_goal(**overrides) -> ConversationGoal:
     """Create a custom goal with specified overrides."""
-    base = PREDEFINED_GOALS['learn_basic_concept'].model_dump()
-    base.update(overrides)
+    base = {**_BASE_GOAL_DUMP, **overrides}
 
     if 'id' not in overrides:
-        import time
-        base['id'] = f'custom-goal-{int(time.time() * 1000)}'
+        # uuid4 stays unique even when many goals are created within the
+        # same millisecond (the old time.time()-based ids collided)
+        base['id'] = f'custom-goal-{uuid.uuid4().hex}'
 
     return ConversationGoal(**base)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import time
 from typing import Dict
 from src.types import UserPersona
 
@@ -49,13 +50,16 @@ PREDEFINED_PERSONAS: Dict[str, UserPersona] = {
 }
 
 
+# The base persona is immutable, so its dump is computed once at import
+# instead of re-serializing all seven fields per call
+_AVERAGE_USER_DUMP = PREDEFINED_PERSONAS['average_user'].model_dump()
+
+
 def create_custom_persona(**overrides) -> UserPersona:
     """Create a custom persona with specified overrides."""
-    base = PREDEFINED_PERSONAS['average_user'].model_dump()
-    base.update(overrides)
+    base = {**_AVERAGE_USER_DUMP, **overrides}
 
     if 'id' not in overrides:
-        import time
         base['id'] = f'custom-{int(time.time() * 1000)}'
 
     return UserPersona(**base)
\ No newline at end of file
@@ -1,11 +1,14 @@
-import json
-from datetime import datetime
+import asyncio
+import sys
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+import orjson
 from colorama import init, Fore, Style
 
+from src.snapshot_cache import SnapshotStore
 from src.user_simulator import UserSimulator
-from src.assistant_client import AssistantClient, AssistantClientConfig
+from src.assistant_client import AsyncAssistantClient, AssistantClientConfig
 from src.evaluator import ConversationEvaluator
 from src.types import SimulationConfig, SimulationResult
 
@@ -14,36 +17,63 @@ init(autoreset=True)
 
 
 class SimulationRunner:
-    def __init__(self, config: SimulationConfig, openai_api_key: str):
+    def __init__(self, config: SimulationConfig, openai_api_key: str, http_client=None):
         self.config = config
         self.user_simulator = UserSimulator(openai_api_key, config.persona, config.goal, model=config.model)
-        self.assistant_client = AssistantClient(
-            AssistantClientConfig(api_endpoint=config.api_endpoint)
+        self.assistant_client = AsyncAssistantClient(
+            AssistantClientConfig(api_endpoint=config.api_endpoint),
+            client=http_client,
         )
         self.evaluator = ConversationEvaluator(openai_api_key, model=config.model)
+        self.snapshots = SnapshotStore() if config.snapshot_cache else None
         self.response_times: List[float] = []
         self.errors: List[str] = []
+        # In quiet mode output is buffered and written once at the end, so
+        # concurrent sweep runners neither interleave lines nor serialize
+        # on the stdout lock mid-run
+        self._log: Optional[List[str]] = [] if config.quiet else None
+
+    def _emit(self, color: str, text: str):
+        """Print a line now, or buffer it when running quiet."""
+        line = f"{color}{text}{Style.RESET_ALL}\n"
+        if self._log is not None:
+            self._log.append(line)
+        else:
+            sys.stdout.write(line)
 
     def run(self) -> SimulationResult:
-        """Run the simulation."""
-        print(f"{Fore.CYAN}\nStarting Simulation")
-        print(f"{Fore.WHITE}Persona: {self.config.persona.name}")
-        print(f"{Fore.WHITE}Goal: {self.config.goal.description}")
-        print(f"{Fore.WHITE}Max Turns: {self.config.max_turns}\n")
+        """Blocking wrapper around run_async for synchronous callers."""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> SimulationResult:
+        """Run the simulation.
+
+        The whole turn loop is async: the user simulator, the assistant
+        client and the evaluator all await their I/O, so many runners can
+        share one event loop and overlap their network waits.
+        """
+        self._emit(Fore.CYAN, "\nStarting Simulation")
+        self._emit(Fore.WHITE, f"Persona: {self.config.persona.name}")
+        self._emit(Fore.WHITE, f"Goal: {self.config.goal.description}")
+        self._emit(Fore.WHITE, f"Max Turns: {self.config.max_turns}\n")
 
         start_time = datetime.now()
 
         try:
-            self._run_conversation()
+            await self._run_conversation()
         except Exception as e:
-            print(f"{Fore.RED}Simulation error: {e}")
+            self._emit(Fore.RED, f"Simulation error: {e}")
             self.errors.append(str(e))
+        finally:
+            await self.assistant_client.close()
 
         end_time = datetime.now()
-        conversation = self.user_simulator.get_state()
+        # One isolated copy for the persisted result; the turn loop reads
+        # the live state directly
+        conversation = self.user_simulator.get_state().model_copy(deep=True)
 
-        print(f"{Fore.CYAN}\nEvaluating Conversation...")
-        metrics = self.evaluator.evaluate(
+        self._emit(Fore.CYAN, "\nEvaluating Conversation...")
+        metrics = await self.evaluator.evaluate(
             conversation,
             self.config.goal,
             self.config.persona,
@@ -63,18 +93,71 @@ class SimulationRunner:
             errors=self.errors if self.errors else None,
         )
 
-        self._save_results(result)
+        # File write runs in a worker thread so concurrent runners sharing
+        # this event loop are not blocked on disk I/O
+        await asyncio.to_thread(self._save_results, result)
         self._print_report(result)
 
+        if self._log is not None:
+            sys.stdout.write(''.join(self._log))
+            self._log.clear()
+
         return result
 
-    def _run_conversation(self):
-        """Run the conversation between user and assistant."""
-        # Generate initial message
-        initial_message = self.user_simulator.generate_initial_message()
-        self.user_simulator.add_user_message(initial_message)
+    def _snapshot_key(self) -> str:
+        """Key for the current conversation prefix."""
+        roles, contents = self.user_simulator.columns()
+        return SnapshotStore.prefix_key(
+            self.config.persona.id,
+            self.config.goal.id,
+            self.config.model,
+            roles,
+            contents,
+        )
 
-        print(f"{Fore.BLUE}USER: {initial_message}")
+    def _take_snapshot(self, should_continue: bool) -> dict:
+        return {
+            'state': self.user_simulator.state.model_copy(deep=True),
+            'response_times': list(self.response_times),
+            'errors': list(self.errors),
+            'should_continue': should_continue,
+        }
+
+    @staticmethod
+    def _print_delta(chunk: str):
+        """Incrementally print one streamed chunk of the assistant reply."""
+        sys.stdout.write(f"{Fore.GREEN}{chunk}")
+        sys.stdout.flush()
+
+    def _restore_snapshot(self, snapshot: dict) -> None:
+        """Replay a cached turn: restore state and print its new messages."""
+        replay_from = len(self.user_simulator.state.messages)
+        self.user_simulator.restore_state(snapshot['state'].model_copy(deep=True))
+        self.response_times = list(snapshot['response_times'])
+        self.errors = list(snapshot['errors'])
+
+        for msg in self.user_simulator.state.messages[replay_from:]:
+            color = Fore.GREEN if msg.role == 'assistant' else Fore.BLUE
+            self._emit(color, f"{msg.role.upper()} (cached): {msg.content}")
+
+    async def _run_conversation(self):
+        """Run the conversation between user and assistant.
+
+        With the snapshot cache enabled, each completed turn is stored keyed
+        by its conversation prefix; a re-run restores cached turns instead of
+        calling the APIs until the conversation diverges from earlier runs.
+        """
+        # Generate (or replay) the initial message
+        snapshot = self.snapshots.get(self._snapshot_key()) if self.snapshots else None
+        if snapshot is not None:
+            self._restore_snapshot(snapshot)
+        else:
+            key = self._snapshot_key() if self.snapshots else None
+            initial_message = await self.user_simulator.generate_initial_message()
+            self.user_simulator.add_user_message(initial_message)
+            self._emit(Fore.BLUE, f"USER: {initial_message}")
+            if key is not None:
+                self.snapshots.put(key, self._take_snapshot(True))
 
         turn_count = 0
         should_continue = True
@@ -84,43 +167,70 @@ class SimulationRunner:
             and turn_count < self.config.max_turns
             and not self.user_simulator.should_stop()
         ):
-            state = self.user_simulator.get_state()
-
-            # Get assistant response
-            response, response_time, error = self.assistant_client.send_message(
-                state.messages[-1].content,
-                state.messages[:-1]
+            key = self._snapshot_key() if self.snapshots else None
+            if key is not None:
+                snapshot = self.snapshots.get(key)
+                if snapshot is not None:
+                    self._restore_snapshot(snapshot)
+                    should_continue = snapshot['should_continue']
+                    if not should_continue:
+                        self._emit(Fore.YELLOW, "\nUser ended conversation")
+                    turn_count += 1
+                    continue
+
+            # Pass the live message list by reference; history_len marks
+            # everything before the trailing user message as history, so
+            # no per-turn O(N) slice copy is made
+            msgs = self.user_simulator.state.messages
+
+            # Get assistant response; when interactive, print tokens as
+            # they stream in, otherwise buffer the finished reply
+            stream_live = self._log is None
+            if stream_live:
+                sys.stdout.write(f"{Fore.GREEN}ASSISTANT: ")
+                sys.stdout.flush()
+            response, response_time, error = await self.assistant_client.send_message(
+                msgs[-1].content,
+                msgs,
+                on_delta=self._print_delta if stream_live else None,
+                history_len=len(msgs) - 1,
             )
+            if stream_live:
+                sys.stdout.write(f"{Style.RESET_ALL}\n")
 
             if error:
-                print(f"{Fore.RED}ERROR: {error}")
+                self._emit(Fore.RED, f"ERROR: {error}")
                 self.errors.append(error)
                 break
 
             self.response_times.append(response_time)
-            print(f"{Fore.GREEN}ASSISTANT: {response}")
+            if not stream_live:
+                self._emit(Fore.GREEN, f"ASSISTANT: {response}")
 
             # Add assistant message to conversation history
             self.user_simulator.add_assistant_message(response)
 
             # Generate user response
-            user_message, should_continue, satisfaction = self.user_simulator.generate_response(
+            user_message, should_continue, satisfaction = await self.user_simulator.generate_response(
                 response
             )
 
             if user_message:
                 self.user_simulator.add_user_message(user_message)
-                print(f"{Fore.BLUE}USER: {user_message}")
+                self._emit(Fore.BLUE, f"USER: {user_message}")
 
             self.user_simulator.update_satisfaction(satisfaction)
 
+            if key is not None:
+                self.snapshots.put(key, self._take_snapshot(should_continue))
+
             if not should_continue:
-                print(f"{Fore.YELLOW}\nUser ended conversation")
+                self._emit(Fore.YELLOW, "\nUser ended conversation")
 
             turn_count += 1
 
         if turn_count >= self.config.max_turns:
-            print(f"{Fore.YELLOW}\nMaximum turns reached")
+            self._emit(Fore.YELLOW, "\nMaximum turns reached")
 
     def _save_results(self, result: SimulationResult):
         """Save simulation results to a JSON file."""
@@ -133,17 +243,25 @@ class SimulationRunner:
         # Convert Pydantic models to dict for JSON serialization
         result_dict = result.model_dump(mode='json')
 
-        with open(filepath, 'w') as f:
-            json.dump(result_dict, f, indent=2)
+        # Message timestamps are monotonic offsets; anchor them to the
+        # simulator's start epoch for human-readable output
+        start_epoch = self.user_simulator.start_epoch
+        for msg in result_dict['conversation']['messages']:
+            msg['timestamp'] = (
+                start_epoch + timedelta(microseconds=msg['timestamp'] // 1000)
+            ).isoformat()
+
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(result_dict, option=orjson.OPT_INDENT_2))
 
-        print(f"{Fore.WHITE}\nResults saved to: {filepath}")
+        self._emit(Fore.WHITE, f"\nResults saved to: {filepath}")
 
     def _print_report(self, result: SimulationResult):
         """Print the evaluation report."""
         report = self.evaluator.generate_report(result.metrics)
-        print(report)
+        self._emit('', report)
 
         if result.errors:
-            print(f"{Fore.RED}\n⚠️ Errors encountered:")
+            self._emit(Fore.RED, "\n⚠️ Errors encountered:")
             for error in result.errors:
-                print(f"{Fore.RED}  - {error}")
\ No newline at end of file
+                self._emit(Fore.RED, f"  - {error}")
\ No newline at end of file
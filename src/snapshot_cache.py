@@ -0,0 +1,52 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+
+class SnapshotStore:
+    """Disk store of per-turn conversation snapshots for prefix reuse.
+
+    Sweeping personas x goals (or re-running one config) regenerates
+    identical early turns, paying OpenAI tokens and latency for messages
+    that already exist on disk. After each completed turn the runner stores
+    a snapshot keyed by a hash of (persona, goal, model, messages-so-far);
+    a later run that reaches the same prefix restores the snapshot instead
+    of calling the APIs, and only pays for turns past the divergence point.
+    """
+
+    def __init__(self, root: str = 'simulation/snapshots'):
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def prefix_key(
+        persona_id: str,
+        goal_id: str,
+        model: str,
+        roles: List[str],
+        contents: List[str],
+    ) -> str:
+        """Content-addressed key for a conversation prefix.
+
+        Takes the columnar role/content lists so per-turn keying hashes
+        plain strings with no per-message attribute access.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(orjson.dumps([persona_id, goal_id, model, roles, contents]))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load the snapshot stored under key, or None."""
+        path = self._root / f'{key}.pickle'
+        try:
+            return pickle.loads(path.read_bytes())
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def put(self, key: str, snapshot: Dict[str, Any]):
+        """Store a snapshot under key."""
+        path = self._root / f'{key}.pickle'
+        path.write_bytes(pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
@@ -1,9 +1,13 @@
 from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserPersona(BaseModel):
+    # Personas never change mid-run; freezing makes instances hashable and
+    # safe to share across concurrent simulations
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
@@ -16,6 +20,8 @@ class UserPersona(BaseModel):
 
 
 class ConversationGoal(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     description: str
     success_criteria: List[str]
@@ -25,9 +31,13 @@ class ConversationGoal(BaseModel):
 
 
 class Message(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     role: Literal['user', 'assistant']
     content: str
-    timestamp: datetime
+    # Monotonic nanoseconds since simulation start; rendered back to a
+    # wall-clock ISO timestamp only when results are saved
+    timestamp: int
     turn_number: int
 
 
@@ -48,6 +58,8 @@ class SimulationConfig(BaseModel):
     api_endpoint: str
     simulation_id: str
     seed: Optional[int] = None
+    snapshot_cache: bool = True
+    quiet: bool = False
 
 
 class EvaluationMetrics(BaseModel):
@@ -1,6 +1,11 @@
-from typing import Dict, Tuple
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Tuple
 from datetime import datetime
-from openai import OpenAI
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict, Field
+from src._sim_numeric import update_progress_frustration
 from src.types import (
     UserPersona,
     ConversationGoal,
@@ -9,12 +14,88 @@ from src.types import (
 )
 
 
+class SimResponse(BaseModel):
+    """Structured simulated-user turn returned by the model."""
+    model_config = ConfigDict(extra='forbid', populate_by_name=True)
+
+    message: str
+    continue_: bool = Field(alias='continue')
+    satisfaction: float
+    reason: str
+
+
+_TRAIT_DESC = {
+    'patience': {
+        'low': 'very impatient, wants quick answers',
+        'high': 'very patient, willing to explore topics deeply',
+    },
+    'expertise': {
+        'low': 'novice, needs simple explanations',
+        'high': 'expert, understands complex concepts',
+    },
+    'verbosity': {
+        'low': 'concise, uses few words',
+        'high': 'verbose, provides detailed context',
+    },
+}
+
+
+@lru_cache(maxsize=64)
+def _get_trait_description(trait: str, value: float) -> str:
+    """Get a descriptive text for a trait value."""
+    desc = _TRAIT_DESC.get(trait)
+    if not desc:
+        return ''
+
+    if value < 0.3:
+        return desc['low']
+    elif value > 0.7:
+        return desc['high']
+    else:
+        return 'moderate'
+
+
+# Pre-bound format method for the volatile tail of the per-turn prompt;
+# the template string is built once instead of re-compiling an f-string
+# with eight interpolations every turn
+_RESPONSE_STATE_TMPL = """
+
+        Current conversation state:
+        - Turn number: {turn}
+        - Goal progress: {progress:.0f}%
+        - Your frustration level: {frustration:.0f}%
+        - Your satisfaction: {satisfaction:.0f}%
+
+        Recent conversation:
+        {context}""".format
+
+
+# Strict schema so the model emits exactly these fields as JSON, with no
+# label-prefix boilerplate to generate or parse
+_SIM_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'sim_response',
+        'strict': True,
+        'schema': SimResponse.model_json_schema(by_alias=True),
+    },
+}
+
+
 class UserSimulator:
     def __init__(self, openai_api_key: str, persona: UserPersona, goal: ConversationGoal, model: str = 'gpt-4o'):
-        self.client = OpenAI(api_key=openai_api_key)
+        self.client = AsyncOpenAI(api_key=openai_api_key)
         self.persona = persona
         self.goal = goal
         self.model = model
+        # Per-turn constants hoisted out of the loop: expected turn count
+        # (with its fallback) and the stop threshold derived from it
+        self._expected_turns = goal.expected_turns or 10
+        self._stop_turn = self._expected_turns * 2
+        # Message timestamps are cheap monotonic offsets from this base;
+        # start_epoch anchors them back to wall-clock time when saving
+        self._start_ns = time.monotonic_ns()
+        self.start_epoch = datetime.now()
         self.state = ConversationState(
             messages=[],
             current_turn=0,
@@ -23,11 +104,24 @@ class UserSimulator:
             frustration_level=0.0,
             context={},
         )
+        # Pre-formatted tail of the conversation; the deque keeps context
+        # construction O(1) instead of re-slicing and re-formatting the
+        # (unbounded) message list on every turn
+        self._recent_formatted: Deque[str] = deque(maxlen=6)
 
-    def generate_initial_message(self) -> str:
-        """Generate the first message to start a conversation."""
-        system_prompt = self._build_system_prompt()
-        user_prompt = f"""Generate the first message to start a conversation about: "{self.goal.description}".
+        # Columnar mirror of state.messages (roles and contents as plain
+        # lists). Hot paths that only need text — snapshot keying, history
+        # serialization — scan these instead of Pydantic objects
+        self._roles: List[str] = []
+        self._contents: List[str] = []
+
+        # Persona and goal are immutable for the run, so the system prompt
+        # is rendered exactly once instead of on every API call
+        self._system_prompt = self._build_system_prompt()
+
+        # The opening prompt depends only on the goal and persona, so it
+        # is rendered once alongside the other per-run constants
+        self._initial_prompt = f"""Generate the first message to start a conversation about: "{self.goal.description}".
 
         Remember your persona traits:
         - Patience level: {self.persona.patience}
@@ -36,71 +130,89 @@ class UserSimulator:
 
         Make the message natural and consistent with these traits."""
 
-        response = self.client.chat.completions.create(
+        # Static head of the per-turn response prompt, built once: persona
+        # traits, success criteria and the output format never change, so
+        # keeping them ahead of the volatile counters preserves the cached
+        # prompt prefix across turns
+        self._criteria_block = '\n'.join(f'- {c}' for c in goal.success_criteria)
+        self._response_prompt_head = f"""Based on the assistant's last response, generate your next message.
+
+        Success criteria for your goal:
+        {self._criteria_block}
+
+        Generate your response based on:
+        1. Your persona traits (patience: {self.persona.patience}, expertise: {self.persona.expertise})
+        2. Whether the assistant is helping you achieve your goal
+        3. Your current frustration and satisfaction levels
+
+        Respond with a JSON object containing:
+        - message: your next message to the assistant
+        - continue: whether you want to keep the conversation going
+        - satisfaction: how satisfied you are so far, from 0 to 1
+        - reason: a brief reason for your satisfaction and decision"""
+
+    async def generate_initial_message(self) -> str:
+        """Generate the first message to start a conversation."""
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=[
-                {'role': 'system', 'content': system_prompt},
-                {'role': 'user', 'content': user_prompt},
+                {'role': 'system', 'content': self._system_prompt},
+                {'role': 'user', 'content': self._initial_prompt},
             ],
             max_completion_tokens=300,
         )
 
         return response.choices[0].message.content or ''
 
-    def generate_response(self, assistant_message: str) -> Tuple[str, bool, float]:
+    async def generate_response(self, assistant_message: str) -> Tuple[str, bool, float]:
         """
         Generate a response to the assistant's message.
         Returns: (message, should_continue, satisfaction)
         """
+        return (await self.generate_response_candidates(assistant_message, 1))[0]
+
+    async def generate_response_candidates(
+        self,
+        assistant_message: str,
+        k: int,
+    ) -> List[Tuple[str, bool, float]]:
+        """
+        Generate k candidate responses to the assistant's message in one
+        API call (n=k), sharing a single prompt-processing pass. Used by
+        Monte-Carlo sweeps that branch one rollout per candidate.
+        Returns: k tuples of (message, should_continue, satisfaction)
+        """
         self._update_state(assistant_message)
 
-        system_prompt = self._build_system_prompt()
         conversation_context = self._build_conversation_context()
 
-        user_prompt = f"""Based on the assistant's last response, generate your next message.
-
-        Current conversation state:
-        - Turn number: {self.state.current_turn}
-        - Goal progress: {self.state.goal_progress * 100:.0f}%
-        - Your frustration level: {self.state.frustration_level * 100:.0f}%
-        - Your satisfaction: {self.state.user_satisfaction * 100:.0f}%
-
-        Success criteria for your goal:
-        {chr(10).join(f'- {c}' for c in self.goal.success_criteria)}
-
-        Recent conversation:
-        {conversation_context}
-
-        Generate your response based on:
-        1. Your persona traits (patience: {self.persona.patience}, expertise: {self.persona.expertise})
-        2. Whether the assistant is helping you achieve your goal
-        3. Your current frustration and satisfaction levels
-
-        YOU MUST format your response EXACTLY like this:
-        MESSAGE: [your message]
-        CONTINUE: [true/false]
-        SATISFACTION: [0-1]
-        REASON: [brief reason]
-
-        Example:
-        MESSAGE: Could you try explaining it in a different way?
-        CONTINUE: true
-        SATISFACTION: 0.3
-        REASON: Assistant didn't provide helpful information
-
-        IMPORTANT: Always include all four fields (MESSAGE, CONTINUE, SATISFACTION, REASON) in your response."""
+        # Static instructions first, volatile state last: the prompt prefix
+        # (system + instruction block) stays byte-identical across turns, so
+        # server-side prompt caching only reprocesses the dynamic tail
+        state = self.state
+        user_prompt = self._response_prompt_head + _RESPONSE_STATE_TMPL(
+            turn=state.current_turn,
+            progress=state.goal_progress * 100,
+            frustration=state.frustration_level * 100,
+            satisfaction=state.user_satisfaction * 100,
+            context=conversation_context,
+        )
 
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model=self.model,
             messages=[
-                {'role': 'system', 'content': system_prompt},
+                {'role': 'system', 'content': self._system_prompt},
                 {'role': 'user', 'content': user_prompt},
             ],
             max_completion_tokens=500,
+            n=k,
+            response_format=_SIM_RESPONSE_FORMAT,
         )
 
-        content = response.choices[0].message.content or ''
-        return self._parse_simulated_response(content)
+        return [
+            self._parse_simulated_response(choice.message.content or '')
+            for choice in response.choices
+        ]
 
     def _build_system_prompt(self) -> str:
         """Build the system prompt for the simulated user."""
@@ -110,9 +222,9 @@ class UserSimulator:
         Description: {self.persona.description}
 
         Personality Traits (0-1 scale):
-        - Patience: {self.persona.patience} ({self._get_trait_description('patience', self.persona.patience)})
-        - Expertise: {self.persona.expertise} ({self._get_trait_description('expertise', self.persona.expertise)})
-        - Verbosity: {self.persona.verbosity} ({self._get_trait_description('verbosity', self.persona.verbosity)})
+        - Patience: {self.persona.patience} ({_get_trait_description('patience', self.persona.patience)})
+        - Expertise: {self.persona.expertise} ({_get_trait_description('expertise', self.persona.expertise)})
+        - Verbosity: {self.persona.verbosity} ({_get_trait_description('verbosity', self.persona.verbosity)})
         - Frustration Tolerance: {self.persona.frustration_tolerance}
         - Communication Clarity: {self.persona.clarity_of_communication}
         - Technical Level: {self.persona.technical_level}
@@ -126,133 +238,105 @@ class UserSimulator:
         Express frustration or satisfaction naturally based on your persona.
         Use language and terminology appropriate to your technical level."""
 
-    def _get_trait_description(self, trait: str, value: float) -> str:
-        """Get a descriptive text for a trait value."""
-        descriptions = {
-            'patience': {
-                'low': 'very impatient, wants quick answers',
-                'high': 'very patient, willing to explore topics deeply',
-            },
-            'expertise': {
-                'low': 'novice, needs simple explanations',
-                'high': 'expert, understands complex concepts',
-            },
-            'verbosity': {
-                'low': 'concise, uses few words',
-                'high': 'verbose, provides detailed context',
-            },
-        }
-
-        desc = descriptions.get(trait)
-        if not desc:
-            return ''
-
-        if value < 0.3:
-            return desc['low']
-        elif value > 0.7:
-            return desc['high']
-        else:
-            return 'moderate'
-
     def _build_conversation_context(self) -> str:
         """Build a string representation of recent conversation."""
-        recent_messages = self.state.messages[-6:]
-        return '\n\n'.join(
-            f"{msg.role.upper()}: {msg.content}"
-            for msg in recent_messages
-        )
+        return '\n\n'.join(self._recent_formatted)
 
     def _parse_simulated_response(self, content: str) -> Tuple[str, bool, float]:
         """Parse the simulated response into components."""
-        lines = content.split('\n')
-        message = ''
-        should_continue = True
-        satisfaction = 0.5
-
-        for line in lines:
-            if line.startswith('MESSAGE:'):
-                message = line.replace('MESSAGE:', '').strip()
-            elif line.startswith('CONTINUE:'):
-                should_continue = 'true' in line.lower()
-            elif line.startswith('SATISFACTION:'):
-                import re
-                match = re.search(r'[\d.]+', line)
-                if match:
-                    satisfaction = float(match.group())
-
-        return message, should_continue, satisfaction
+        try:
+            parsed = SimResponse.model_validate_json(content)
+        except ValueError:
+            print(f"❌ Wrong response format from the user simulator: {content}")
+            return '', True, 0.5
+
+        return parsed.message, parsed.continue_, max(0.0, min(1.0, parsed.satisfaction))
 
     def _update_state(self, assistant_message: str):
         """Update the conversation state with a new assistant message."""
         assistant_msg = Message(
             role='assistant',
             content=assistant_message,
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns() - self._start_ns,
             turn_number=self.state.current_turn,
         )
 
         self.state.messages.append(assistant_msg)
+        self._roles.append('assistant')
+        self._contents.append(assistant_message)
+        self._recent_formatted.append(f"ASSISTANT: {assistant_message}")
         self.state.current_turn += 1
 
-        self._update_goal_progress()
-        self._update_frustration_level()
-
-    def _update_goal_progress(self):
-        """Update the progress toward the goal."""
-        progress_per_turn = 1 / (self.goal.expected_turns or 10)
-        self.state.goal_progress = min(
-            1.0,
-            self.state.goal_progress + progress_per_turn
+        # One fused call over plain floats; see src/_sim_numeric.py
+        state = self.state
+        state.goal_progress, state.frustration_level = update_progress_frustration(
+            state.current_turn,
+            self._expected_turns,
+            state.goal_progress,
+            state.frustration_level,
+            state.user_satisfaction,
+            self.persona.patience,
+            self.persona.frustration_tolerance,
         )
 
-    def _update_frustration_level(self):
-        """Update the user's frustration level."""
-        turn_ratio = self.state.current_turn / (self.goal.expected_turns or 10)
-
-        if turn_ratio > 1.5:
-            self.state.frustration_level = min(
-                1.0,
-                self.state.frustration_level + (1 - self.persona.patience) * 0.1
-            )
-
-        if self.state.user_satisfaction < 0.3:
-            self.state.frustration_level = min(
-                1.0,
-                self.state.frustration_level + (1 - self.persona.frustration_tolerance) * 0.15
-            )
-
     def add_user_message(self, content: str):
         """Add a user message to the conversation state."""
         user_msg = Message(
             role='user',
             content=content,
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns() - self._start_ns,
             turn_number=self.state.current_turn,
         )
         self.state.messages.append(user_msg)
+        self._roles.append('user')
+        self._contents.append(content)
+        self._recent_formatted.append(f"USER: {content}")
 
     def add_assistant_message(self, content: str):
         """Add an assistant message to the conversation state."""
         assistant_msg = Message(
             role='assistant',
             content=content,
-            timestamp=datetime.now(),
+            timestamp=time.monotonic_ns() - self._start_ns,
             turn_number=self.state.current_turn,
         )
         self.state.messages.append(assistant_msg)
+        self._roles.append('assistant')
+        self._contents.append(content)
+        self._recent_formatted.append(f"ASSISTANT: {content}")
 
     def update_satisfaction(self, value: float):
         """Update the user satisfaction level."""
         self.state.user_satisfaction = max(0, min(1, value))
 
+    def restore_state(self, state: ConversationState):
+        """Replace the conversation state and rebuild derived context."""
+        self.state = state
+        self._roles = [msg.role for msg in state.messages]
+        self._contents = [msg.content for msg in state.messages]
+        self._recent_formatted.clear()
+        self._recent_formatted.extend(
+            f"{msg.role.upper()}: {msg.content}"
+            for msg in state.messages[-6:]
+        )
+
+    def columns(self) -> Tuple[List[str], List[str]]:
+        """Role and content columns of the conversation so far."""
+        return self._roles, self._contents
+
     def get_state(self) -> ConversationState:
-        """Get the current conversation state."""
-        return self.state.model_copy()
+        """Get the current conversation state.
+
+        Returns the live state object; callers that need an isolated
+        snapshot (e.g. for persistence) should model_copy(deep=True) it.
+        """
+        return self.state
 
     def should_stop(self) -> bool:
         """Check if the simulation should stop."""
+        state = self.state
         return (
-            self.state.current_turn >= (self.goal.expected_turns or 10) * 2 or
-            self.state.frustration_level > 0.9 or
-            self.state.goal_progress >= 1
+            state.current_turn >= self._stop_turn or
+            state.frustration_level > 0.9 or
+            state.goal_progress >= 1
         )
\ No newline at end of file